@@ -1,58 +1,77 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import csv
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+strided_files = {}
+for path in Path('.').glob('strided_access_*.csv'):
+    stride = path.stem.rsplit('_', 1)[1]
+    if stride.isdigit():
+        strided_files[int(stride)] = path
+
+# Bail out before the (slow) matplotlib import if there is nothing to plot
+if not (strided_files or os.path.exists('sequential_access.csv') or os.path.exists('random_access.csv')):
+    print("No cache benchmark CSV files found, nothing to plot")
+    sys.exit(0)
+
+import matplotlib
+matplotlib.use('Agg')  # Render straight to PNG, no display backend probe
+from matplotlib.figure import Figure
+import numpy as np
 
 def read_csv(filename):
-    sizes = []
-    times = []
-    
-    with open(filename, 'r') as f:
-        reader = csv.reader(f)
-        next(reader)  # Skip header
-        for row in reader:
-            sizes.append(int(row[0]))
-            times.append(float(row[1]))
-    
-    return np.array(sizes), np.array(times)
-
-# Plot sequential vs random access
-plt.figure(figsize=(10, 6))
-
-if os.path.exists('sequential_access.csv'):
-    seq_sizes, seq_times = read_csv('sequential_access.csv')
-    plt.plot(seq_sizes, seq_times, 'b-', label='Sequential Access')
-
-if os.path.exists('random_access.csv'):
-    rand_sizes, rand_times = read_csv('random_access.csv')
-    plt.plot(rand_sizes, rand_times, 'r-', label='Random Access')
-
-plt.xscale('log')
-plt.yscale('log')
-plt.xlabel('Array Size (bytes)')
-plt.ylabel('Access Time (ns)')
-plt.title('Cache Performance: Sequential vs Random Access')
-plt.legend()
-plt.grid(True)
-plt.savefig('cache_sequential_vs_random.png')
-
-# Plot strided access
-plt.figure(figsize=(10, 6))
-
-strides = [1, 2, 4, 8, 16, 32, 64, 128]
-for stride in strides:
-    filename = f'strided_access_{stride}.csv'
-    if os.path.exists(filename):
-        sizes, times = read_csv(filename)
-        plt.plot(sizes, times, label=f'Stride {stride}')
-
-plt.xscale('log')
-plt.yscale('log')
-plt.xlabel('Array Size (bytes)')
-plt.ylabel('Access Time (ns)')
-plt.title('Cache Performance: Strided Access')
-plt.legend()
-plt.grid(True)
-plt.savefig('cache_strided_access.png')
-
-print("Plots saved as cache_sequential_vs_random.png and cache_strided_access.png")
\ No newline at end of file
+    # cache_benchmark prints a short preamble and a header before the data
+    # rows; find the header once, then let loadtxt parse the rest in C
+    with open(filename) as f:
+        for line in f:
+            if line.startswith('Array size'):
+                break
+        else:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        data = np.loadtxt(f, delimiter=',', usecols=(0, 1), ndmin=2)
+
+    return data[:, 0].astype(np.int64), data[:, 1]
+
+def finish_plot(fig, ax, title, filename):
+    ax.set_xscale('log')
+    ax.set_yscale('log')
+    ax.set_xlabel('Array Size (bytes)')
+    ax.set_ylabel('Access Time (ns)')
+    ax.set_title(title)
+    ax.legend()
+    ax.grid(True)
+    fig.savefig(filename)
+
+# Each plot uses its own Figure (no pyplot global state), so the two
+# renders can run concurrently
+def plot_sequential_vs_random():
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+
+    if os.path.exists('sequential_access.csv'):
+        seq_sizes, seq_times = read_csv('sequential_access.csv')
+        ax.plot(seq_sizes, seq_times, 'b-', label='Sequential Access')
+
+    if os.path.exists('random_access.csv'):
+        rand_sizes, rand_times = read_csv('random_access.csv')
+        ax.plot(rand_sizes, rand_times, 'r-', label='Random Access')
+
+    finish_plot(fig, ax, 'Cache Performance: Sequential vs Random Access',
+                'cache_sequential_vs_random.png')
+
+def plot_strided_access():
+    fig = Figure(figsize=(10, 6))
+    ax = fig.add_subplot()
+
+    for stride in sorted(strided_files):
+        sizes, times = read_csv(strided_files[stride])
+        ax.plot(sizes, times, label=f'Stride {stride}')
+
+    finish_plot(fig, ax, 'Cache Performance: Strided Access', 'cache_strided_access.png')
+
+with ThreadPoolExecutor(max_workers=2) as executor:
+    futures = [executor.submit(plot_sequential_vs_random), executor.submit(plot_strided_access)]
+    for future in futures:
+        future.result()
+
+print("Plots saved as cache_sequential_vs_random.png and cache_strided_access.png")
@@ -2,6 +2,8 @@
 """CPU utilization benchmark implementation."""
 
 import asyncio
+import io
+import tarfile
 from pathlib import Path
 from typing import Dict, Any
 from .base import Benchmark
@@ -10,63 +12,91 @@ from .base import Benchmark
 class CPUUtilizationBenchmark(Benchmark):
     """CPU utilization benchmark implementation."""
     
+    # Shell snippet that writes all *.txt result files to stdout as a
+    # gzip tarball (or nothing if there are none)
+    _ARCHIVE_RESULTS = "{ ls *.txt >/dev/null 2>&1 && tar czf - *.txt || true; }"
+    
+    # Benchmark scripts in order of preference
+    SCRIPT_PRIORITY = ("cpu_benchmark.sh", "benchmark.sh")
+    
+    # Picks the first available script from {scripts}, runs it, assembles
+    # raw_output.txt and archives the results; the exit status is that of
+    # the benchmark script
+    _RUN_TEMPLATE = (
+        "script=benchmark.sh; "
+        "for s in {scripts}; do if [ -f \"$s\" ]; then script=$s; break; fi; done; "
+        "chmod +x \"$script\" && "
+        "{{ ./\"$script\" > .raw_stdout 2> .raw_stderr; rc=$?; "
+        "{{ printf 'STDOUT:\\n'; cat .raw_stdout; printf '\\n\\nSTDERR:\\n'; cat .raw_stderr; }} > raw_output.txt; "
+        "rm -f .raw_stdout .raw_stderr; {archive}; exit $rc; }}"
+    )
+    
     def __init__(self):
         super().__init__("CPU Utilization", "100_cpu_utilization")
     
     async def run(self, ssh_client, temp_dir: str, output_dir: Path) -> Dict[str, Any]:
         """Run CPU utilization benchmark."""
-        # Get available scripts
-        exit_code, stdout, stderr = ssh_client.run_command(
-            f"cd ~/benchmarks/{temp_dir}/bench_guide/{self.path} && ls -la *.sh",
-            capture_output=True
-        )
+        remote_dir = f"~/benchmarks/{temp_dir}/bench_guide/{self.path}"
         
-        script_name = self.get_script_name(stdout.splitlines())
-        
-        # Run benchmark
-        exit_code, stdout, stderr = ssh_client.run_command(
-            f"cd ~/benchmarks/{temp_dir}/bench_guide/{self.path} && chmod +x {script_name} && ./{script_name}",
-            capture_output=True
+        # Select the script, run the benchmark and stream back its result
+        # files in a single SSH command: the output is written to
+        # raw_output.txt on the remote side and every *.txt file is emitted as
+        # a tarball on stdout, captured as raw bytes, while the exit status is
+        # that of the benchmark script
+        exit_code, stdout, stderr = await ssh_client.run_command_async(
+            self._RUN_TEMPLATE.format(scripts=" ".join(self.SCRIPT_PRIORITY),
+                                      archive=self._ARCHIVE_RESULTS),
+            capture_output=True,
+            binary=True,
+            cwd=remote_dir
         )
         
-        # Save raw output
+        # Unpack result files (including raw_output.txt)
         raw_output_path = output_dir / f"{ssh_client.instance['name']}__raw_output.txt"
-        with open(raw_output_path, 'w') as f:
-            f.write(f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}")
+        self._extract_result_files(ssh_client, stdout, output_dir)
         
-        # Collect result files
-        await self._collect_result_files(ssh_client, temp_dir, output_dir)
+        # If the remote side failed before assembling raw_output.txt (e.g.
+        # the cd or chmod failed) keep what the command printed instead
+        if not raw_output_path.exists():
+            with open(raw_output_path, 'w') as f:
+                f.write("STDOUT:\n" + stdout.decode(errors='replace') +
+                        "\n\nSTDERR:\n" + stderr.decode(errors='replace'))
         
         return {"exit_code": exit_code, "raw_output_path": str(raw_output_path)}
     
     def get_script_name(self, available_scripts: list) -> str:
         """Determine which script to run."""
-        for line in available_scripts:
-            if "cpu_benchmark.sh" in line:
-                return "cpu_benchmark.sh"
-            elif "benchmark.sh" in line:
-                return "benchmark.sh"
+        # Accept bare file names as well as `ls -la` lines (name is last)
+        names = {line.split()[-1] for line in available_scripts if line.strip()}
+        for script in self.SCRIPT_PRIORITY:
+            if script in names:
+                return script
         return "benchmark.sh"  # fallback
     
-    async def _collect_result_files(self, ssh_client, temp_dir: str, output_dir: Path):
-        """Collect all result files from remote instance."""
-        # Get list of output files
-        exit_code, stdout, stderr = ssh_client.run_command(
-            f"cd ~/benchmarks/{temp_dir}/bench_guide/{self.path} && ls -1 *.txt 2>/dev/null || true",
-            capture_output=True
-        )
+    def _extract_result_files(self, ssh_client, payload: bytes, output_dir: Path):
+        """Unpack a gzip tarball of result files into output_dir as raw bytes."""
+        if not payload:
+            return
+        
+        try:
+            archive = tarfile.open(fileobj=io.BytesIO(payload), mode='r:gz')
+        except tarfile.TarError as e:
+            print(f"Failed to unpack result files: {e}")
+            return
         
-        if stdout.strip():
-            files = stdout.strip().split('\n')
-            for file in files:
-                if file.strip():
-                    # Download each file
-                    exit_code, content, stderr = ssh_client.run_command(
-                        f"cat ~/benchmarks/{temp_dir}/bench_guide/{self.path}/{file.strip()}",
-                        capture_output=True
-                    )
-                    
-                    if exit_code == 0 and content:
-                        local_path = output_dir / f"{ssh_client.instance['name']}__{file.strip()}"
-                        with open(local_path, 'w') as f:
-                            f.write(content)
\ No newline at end of file
+        with archive:
+            for member in archive.getmembers():
+                if not member.isfile():
+                    continue
+                
+                # Flatten the member name and prefix it with the instance name
+                file_name = Path(member.name).name
+                extracted = archive.extractfile(member)
+                if extracted is None:
+                    continue
+                
+                content = extracted.read()
+                if content:
+                    local_path = output_dir / f"{ssh_client.instance['name']}__{file_name}"
+                    with open(local_path, 'wb') as f:
+                        f.write(content)
@@ -1,16 +1,22 @@
 #!/usr/bin/env python3
 """CLI commands for the benchmark visualizer."""
 
+import os
+import re
 import asyncio
 import argparse
 import webbrowser
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 
 from core.config import Config
 from core.orchestrator import BenchmarkOrchestrator
 from cloud.aws import AWSProvider
 
+# Benchmark directories are named <number>_<name>, e.g. 100_cpu_utilization
+_BENCHMARK_DIR_RE = re.compile(r'^(\d+)_(.+)$')
+
 
 class CLI:
     """Command line interface for benchmark visualizer."""
@@ -53,7 +59,7 @@ class CLI:
         
         print("Reprocessing results...")
         report_path = await self.orchestrator.reprocess_results(results_path)
-        print(f"Report regenerated: {report_path}")
+        print(f"Report ready: {report_path}")
         webbrowser.open(f"file://{report_path}")
     
     async def _run_benchmarks_command(self):
@@ -114,18 +120,24 @@ class CLI:
     
     def _get_available_benchmarks(self) -> List[Dict[str, Any]]:
         """Get list of available benchmarks."""
-        benchmarks = []
-        base_dir = Path(__file__).parent.parent.parent.parent
-        
-        for item in base_dir.iterdir():
-            if item.is_dir() and item.name[0].isdigit() and "_" in item.name:
-                parts = item.name.split("_", 1)
-                if len(parts) == 2 and parts[0].isdigit():
-                    benchmarks.append({
-                        "number": parts[0],
-                        "name": parts[1],
-                        "path": item.name
-                    })
-        
-        benchmarks.sort(key=lambda x: int(x["number"]))
-        return benchmarks
\ No newline at end of file
+        base_dir = Path(__file__).resolve().parent.parent.parent
+        return [dict(benchmark) for benchmark in _scan_benchmarks(base_dir)]
+
+
+@lru_cache(maxsize=8)
+def _scan_benchmarks(base_dir: Path) -> Tuple[Dict[str, Any], ...]:
+    """Scan base_dir for benchmark directories (cached per process)."""
+    benchmarks = []
+    
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            match = _BENCHMARK_DIR_RE.match(entry.name)
+            if match and entry.is_dir(follow_symlinks=False):
+                benchmarks.append({
+                    "number": match.group(1),
+                    "name": match.group(2),
+                    "path": entry.name
+                })
+    
+    benchmarks.sort(key=lambda x: int(x["number"]))
+    return tuple(benchmarks)
@@ -7,8 +7,30 @@ Handles interaction with AWS EC2 instances.
 
 import os
 import boto3
+from botocore.exceptions import ClientError
 from pathlib import Path
 
+# Session shared by all calls, keyed on the (profile, region) it was made for
+_session = None
+_session_key = None
+
+
+def get_session():
+    """
+    Get the shared boto3 session, creating it on first use.
+    
+    Returns:
+        boto3.Session: Session for the AWS_DEFAULT_PROFILE and AWS_REGION
+        environment settings
+    """
+    global _session, _session_key
+    # Get AWS credentials from environment
+    key = (os.environ.get('AWS_DEFAULT_PROFILE'), os.environ.get('AWS_REGION', 'us-west-2'))
+    if _session is None or _session_key != key:
+        _session = boto3.Session(profile_name=key[0], region_name=key[1])
+        _session_key = key
+    return _session
+
 
 def get_instances():
     """
@@ -18,39 +40,42 @@ def get_instances():
         list: List of instance dictionaries with name, ip, username, and key_path
     """
     try:
-        # Get AWS credentials from environment
-        region = os.environ.get('AWS_REGION', 'us-west-2')
-        profile = os.environ.get('AWS_DEFAULT_PROFILE')
+        session = get_session()
+        ec2_client = session.client('ec2')
         
-        # Initialize boto3 client
-        session = boto3.Session(profile_name=profile, region_name=region)
-        ec2 = session.resource('ec2')
+        # Get running instances; DescribeInstances returns every field we need,
+        # so no per-instance attribute loads are triggered
+        running = []
+        paginator = ec2_client.get_paginator('describe_instances')
+        for page in paginator.paginate(Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]):
+            for reservation in page['Reservations']:
+                for instance in reservation['Instances']:
+                    if instance.get('Platform') == "windows":
+                        continue  # Skip Windows instances
+                    running.append(instance)
+        
+        # Resolve usernames for all AMIs in a single DescribeImages call
+        usernames = get_usernames_for_amis({instance['ImageId'] for instance in running}, session)
         
-        # Get running instances
         instances = []
-        for instance in ec2.instances.filter(Filters=[{'Name': 'instance-state-name', 'Values': ['running']}]):
+        for instance in running:
             # Get instance name from tags
             name = "unnamed"
-            for tag in instance.tags or []:
+            for tag in instance.get('Tags', []):
                 if tag['Key'] == 'Name':
                     name = tag['Value']
                     break
             
             # Get IP address
-            ip = instance.public_ip_address or instance.private_ip_address
+            ip = instance.get('PublicIpAddress') or instance.get('PrivateIpAddress')
             if not ip:
                 continue
             
-            # Determine username based on platform
-            username = "ubuntu"  # Default to ubuntu
-            if instance.platform == "windows":
-                continue  # Skip Windows instances
-            
             # Get username based on AMI OS
-            username = get_username_for_ami(instance.image_id, session)
+            username = usernames.get(instance['ImageId'], 'ubuntu')
             
             # Get SSH key path
-            key_name = instance.key_name
+            key_name = instance.get('KeyName')
             key_path = os.path.expanduser(f"~/.ssh/{key_name}.pem")
             
             # If key doesn't exist at default location, try to find it
@@ -69,9 +94,9 @@ def get_instances():
                 "ip": ip,
                 "username": username,
                 "key_path": key_path,
-                "instance_id": instance.id,
-                "instance_type": instance.instance_type,
-                "launch_time": instance.launch_time
+                "instance_id": instance['InstanceId'],
+                "instance_type": instance['InstanceType'],
+                "launch_time": instance['LaunchTime']
             })
         
         return instances
@@ -81,67 +106,72 @@ def get_instances():
         return []
 
 
-def get_username_for_ami(ami_id, session):
-    """Determine SSH username based on AMI OS."""
+def get_usernames_for_amis(ami_ids, session):
+    """
+    Determine SSH usernames for a set of AMIs with one DescribeImages call.
+    
+    Args:
+        ami_ids (iterable): AMI IDs to resolve
+        session (boto3.Session): Session used to create the EC2 client
+        
+    Returns:
+        dict: Mapping of AMI ID to SSH username
+    """
+    ami_ids = sorted(set(ami_ids))
+    usernames = dict.fromkeys(ami_ids, 'ubuntu')  # Default fallback
+    if not ami_ids:
+        return usernames
+    
     try:
         ec2_client = session.client('ec2')
+        try:
+            images = ec2_client.describe_images(ImageIds=ami_ids)['Images']
+        except ClientError as e:
+            if not _is_invalid_ami_error(e):
+                raise
+            # One unknown or deregistered AMI fails the whole batch, so
+            # look the IDs up one at a time and skip the bad ones
+            images = []
+            for ami_id in ami_ids:
+                try:
+                    images.extend(ec2_client.describe_images(ImageIds=[ami_id])['Images'])
+                except ClientError as e:
+                    if not _is_invalid_ami_error(e):
+                        raise
+                    print(f"Skipping AMI {ami_id}: {e}")
         
-        # Get AMI details
-        response = ec2_client.describe_images(ImageIds=[ami_id])
-        
-        if not response['Images']:
-            return 'ubuntu'  # Default fallback
-        
-        image = response['Images'][0]
-        
-        # Check image name and description for OS type
-        image_name = image.get('Name', '').lower()
-        description = image.get('Description', '').lower()
-        
-        # Determine username based on OS
-        if 'debian' in image_name or 'debian' in description:
-            return 'admin'
-        elif 'ubuntu' in image_name or 'ubuntu' in description:
-            return 'ubuntu'
-        elif 'amazon' in image_name or 'amzn' in image_name or 'amazon linux' in description:
-            return 'ec2-user'
-        else:
-            # Default to ubuntu if we can't determine
-            return 'ubuntu'
-            
+        for image in images:
+            usernames[image['ImageId']] = _username_for_image(image)
+    
     except Exception as e:
-        print(f"Error determining username for AMI {ami_id}: {e}")
-        return 'ubuntu'  # Default fallback
+        print(f"Error determining usernames for AMIs {', '.join(ami_ids)}: {e}")
+    
+    return usernames
 
 
 def get_username_for_ami(ami_id, session):
     """Determine SSH username based on AMI OS."""
-    try:
-        ec2_client = session.client('ec2')
-        
-        # Get AMI details
-        response = ec2_client.describe_images(ImageIds=[ami_id])
-        
-        if not response['Images']:
-            return 'ubuntu'  # Default fallback
-        
-        image = response['Images'][0]
-        
-        # Check image name and description for OS type
-        image_name = image.get('Name', '').lower()
-        description = image.get('Description', '').lower()
-        
-        # Determine username based on OS
-        if 'debian' in image_name or 'debian' in description:
-            return 'admin'
-        elif 'ubuntu' in image_name or 'ubuntu' in description:
-            return 'ubuntu'
-        elif 'amazon' in image_name or 'amzn' in image_name or 'amazon linux' in description:
-            return 'ec2-user'
-        else:
-            # Default to ubuntu if we can't determine
-            return 'ubuntu'
-            
-    except Exception as e:
-        print(f"Error determining username for AMI {ami_id}: {e}")
-        return 'ubuntu'  # Default fallback
\ No newline at end of file
+    return get_usernames_for_amis([ami_id], session)[ami_id]
+
+
+def _is_invalid_ami_error(error):
+    """Check whether a ClientError reports an unknown or malformed AMI ID."""
+    return error.response.get('Error', {}).get('Code', '').startswith('InvalidAMIID')
+
+
+def _username_for_image(image):
+    """Determine SSH username from a DescribeImages image record."""
+    # Check image name and description for OS type
+    image_name = image.get('Name', '').lower()
+    description = image.get('Description', '').lower()
+    
+    # Determine username based on OS
+    if 'debian' in image_name or 'debian' in description:
+        return 'admin'
+    elif 'ubuntu' in image_name or 'ubuntu' in description:
+        return 'ubuntu'
+    elif 'amazon' in image_name or 'amzn' in image_name or 'amazon linux' in description:
+        return 'ec2-user'
+    else:
+        # Default to ubuntu if we can't determine
+        return 'ubuntu'
@@ -2,25 +2,26 @@
 """Configuration management for the benchmark visualizer."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Dict, Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CloudConfig:
     default_profile: str = "arm"
     ssh_key_path: str = "~/.ssh/gcohen1.pem"
     timeout: int = 300
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkConfig:
     repo_url: str = "https://github.com/geremyCohen/bench_guide"
     default_benchmark: str = "100_cpu_utilization"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     cloud: CloudConfig
     benchmark: BenchmarkConfig
@@ -28,8 +29,9 @@ class Config:
     colors: List[str]
 
     @classmethod
+    @lru_cache(maxsize=None)
     def load(cls) -> 'Config':
-        """Load configuration with defaults."""
+        """Load configuration with defaults (cached per process)."""
         results_dir = Path(__file__).parent.parent / "results"
         results_dir.mkdir(exist_ok=True)
         
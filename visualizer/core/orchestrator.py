@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 """Main orchestrator for benchmark execution with error handling and async processing."""
 
+import os
 import asyncio
 import webbrowser
 from pathlib import Path
@@ -12,7 +13,6 @@ from .session import BenchmarkSession
 from benchmarks.cpu_utilization import CPUUtilizationBenchmark
 from parsers import parse_benchmark_output
 from visualizers import generate_html_report
-from utils.data_processing import DataProcessor
 
 
 class BenchmarkOrchestrator:
@@ -23,10 +23,9 @@ class BenchmarkOrchestrator:
         self.benchmarks = {
             "100_cpu_utilization": CPUUtilizationBenchmark()
         }
-        self.data_processor = DataProcessor()
     
     async def run_benchmarks(self, instances: List[Dict[str, Any]], 
-                           benchmark_names: List[str]) -> str:
+                           benchmark_names: List[str]) -> Path:
         """Run benchmarks on instances with proper error handling."""
         async with BenchmarkSession(self.config) as session:
             run_dir = session.create_run_directory()
@@ -44,7 +43,7 @@ class BenchmarkOrchestrator:
             
             return report_path
     
-    async def reprocess_results(self, results_dir: Path) -> str:
+    async def reprocess_results(self, results_dir: Path) -> Path:
         """Reprocess existing results and regenerate report."""
         results = self._parse_existing_results(results_dir)
         report_path = self._generate_report(results, results_dir)
@@ -66,20 +65,23 @@ class BenchmarkOrchestrator:
     
     async def _setup_single_instance(self, ssh_client, temp_dir: str):
         """Setup benchmark environment on single instance."""
-        commands = [
-            f"mkdir -p ~/benchmarks/{temp_dir}",
-            f"cd ~/benchmarks/{temp_dir} && git clone {self.config.benchmark.repo_url}",
-        ]
-        
-        for cmd in commands:
-            ssh_client.run_command(cmd, capture_output=True)
+        remote_dir = f"~/benchmarks/{temp_dir}"
+        await ssh_client.run_command_async(f"mkdir -p {remote_dir}", capture_output=True)
+        await ssh_client.run_command_async(
+            f"git clone --depth 1 --single-branch --no-tags {self.config.benchmark.repo_url} bench_guide",
+            capture_output=True,
+            cwd=remote_dir
+        )
     
     async def _run_benchmarks_parallel(self, session: BenchmarkSession,
                                      instances: List[Dict[str, Any]],
                                      benchmark_names: List[str],
                                      run_dir: Path, temp_dir: str) -> Dict[str, Any]:
         """Run benchmarks in parallel with error handling."""
-        semaphore = asyncio.Semaphore(3)  # Limit concurrent executions
+        # Runs are I/O-bound SSH waits, so oversubscribe the local cores
+        total_runs = len(instances) * len(benchmark_names)
+        max_concurrent = min(total_runs, max(4, (os.cpu_count() or 4) * 2))
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
         tasks = []
         
         for instance in instances:
@@ -152,44 +154,37 @@ class BenchmarkOrchestrator:
         return processed
     
     def _parse_existing_results(self, results_dir: Path) -> Dict[str, Any]:
-        """Parse existing result files using optimized data processor."""
-        # Use optimized data processor for better performance
-        processed_results = self.data_processor.process_directory(results_dir)
-        
-        # Convert to expected format and fallback to original parser if needed
+        """Parse existing result files."""
         results = {}
         
-        for instance_dir in results_dir.iterdir():
-            if not instance_dir.is_dir() or instance_dir.name == "report.html":
-                continue
-            
-            instance_name = instance_dir.name
-            results[instance_name] = {}
+        groups = []
+        
+        # Layout is <results_dir>/<instance>/<benchmark>/<files>
+        for root, dirs, files in os.walk(results_dir):
+            rel_parts = Path(root).relative_to(results_dir).parts
             
-            for benchmark_dir in instance_dir.iterdir():
-                if not benchmark_dir.is_dir():
-                    continue
-                
-                benchmark_name = benchmark_dir.name
-                benchmark_results = {}
-                
-                for file_path in benchmark_dir.iterdir():
-                    if file_path.is_file():
-                        parsed = parse_benchmark_output.parse_file(str(file_path), benchmark_name)
-                        if parsed:
-                            # Merge parsed results
-                            for key, value in parsed.items():
-                                if key in benchmark_results:
-                                    if isinstance(benchmark_results[key], dict) and isinstance(value, dict):
-                                        benchmark_results[key].update(value)
-                                else:
-                                    benchmark_results[key] = value
-                
-                results[instance_name][benchmark_name] = benchmark_results
+            if len(rel_parts) == 1:
+                results.setdefault(rel_parts[0], {})
+            elif len(rel_parts) == 2:
+                file_paths = [os.path.join(root, name) for name in sorted(files)]
+                groups.append((rel_parts, file_paths))
+                # Nothing to parse below the benchmark directories
+                dirs.clear()
+        
+        # Parse every file in one batch so large result sets use all cores
+        pairs = [(path, rel_parts[1]) for rel_parts, file_paths in groups for path in file_paths]
+        parsed = parse_benchmark_output.parse_file_batch(pairs)
+        
+        offset = 0
+        for (instance_name, benchmark_name), file_paths in groups:
+            end = offset + len(file_paths)
+            results.setdefault(instance_name, {})[benchmark_name] = \
+                parse_benchmark_output.merge_results(parsed[offset:end])
+            offset = end
         
         return results
     
-    def _generate_report(self, results: Dict[str, Any], run_dir: Path) -> str:
+    def _generate_report(self, results: Dict[str, Any], run_dir: Path) -> Path:
         """Generate HTML report from results."""
         report_path = generate_html_report.create_report(results, run_dir)
         return report_path
\ No newline at end of file
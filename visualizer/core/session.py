@@ -1,16 +1,20 @@
 #!/usr/bin/env python3
 """Benchmark session management with proper resource cleanup."""
 
+import os
+import time
+import shutil
 import tempfile
 import asyncio
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from contextlib import asynccontextmanager
-from datetime import datetime
 
 from .config import Config
-from utils.ssh import SSHClient
-from cloud.aws import AWSProvider
+
+if TYPE_CHECKING:
+    from utils.ssh import SSHClient
+    from cloud.aws import AWSProvider
 
 
 class BenchmarkSession:
@@ -19,10 +23,18 @@ class BenchmarkSession:
     def __init__(self, config: Config):
         self.config = config
         self.temp_dirs: List[str] = []
-        self.ssh_clients: Dict[str, SSHClient] = {}
-        self.cloud_provider = AWSProvider()
+        self.ssh_clients: Dict[str, "SSHClient"] = {}
+        self._cloud_provider: Optional["AWSProvider"] = None
         self.created_instances: List[Dict[str, Any]] = []
     
+    @property
+    def cloud_provider(self) -> "AWSProvider":
+        """Cloud provider, created (and boto3 imported) on first use."""
+        if self._cloud_provider is None:
+            from cloud.aws import AWSProvider
+            self._cloud_provider = AWSProvider()
+        return self._cloud_provider
+    
     async def __aenter__(self):
         """Async context manager entry."""
         return self
@@ -31,10 +43,11 @@ class BenchmarkSession:
         """Async context manager exit with cleanup."""
         await self.cleanup()
     
-    def get_ssh_client(self, instance: Dict[str, Any]) -> SSHClient:
+    def get_ssh_client(self, instance: Dict[str, Any]) -> "SSHClient":
         """Get or create SSH client for instance."""
         instance_name = instance['name']
         if instance_name not in self.ssh_clients:
+            from utils.ssh import SSHClient
             self.ssh_clients[instance_name] = SSHClient(instance, self.config.colors)
         return self.ssh_clients[instance_name]
     
@@ -46,25 +59,31 @@ class BenchmarkSession:
     
     def create_run_directory(self) -> Path:
         """Create timestamped run directory."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        run_dir = self.config.results_dir / timestamp
-        run_dir.mkdir(exist_ok=True)
+        # The PID suffix keeps sessions started in the same second apart
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        run_dir = self.config.results_dir / f"{timestamp}_{os.getpid()}"
+        run_dir.mkdir(parents=True, exist_ok=True)
         return run_dir
     
     async def cleanup(self):
         """Clean up all session resources."""
-        # Cleanup temporary directories
-        for temp_dir in self.temp_dirs:
-            try:
-                import shutil
-                shutil.rmtree(temp_dir, ignore_errors=True)
-            except Exception:
-                pass
+        # Remove temporary directories concurrently, off the event loop
+        await asyncio.gather(
+            *(asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
+              for temp_dir in self.temp_dirs),
+            return_exceptions=True
+        )
+        
+        # Close the multiplexed SSH master connections
+        await asyncio.gather(
+            *(asyncio.to_thread(client.close) for client in self.ssh_clients.values()),
+            return_exceptions=True
+        )
         
-        # Cleanup cloud instances if created
+        # Cleanup cloud instances if created (blocking boto3 calls)
         if self.created_instances:
             try:
-                self.cloud_provider.cleanup_instances(self.created_instances)
+                await asyncio.to_thread(self.cloud_provider.cleanup_instances, self.created_instances)
             except Exception:
                 pass
         
@@ -6,34 +6,141 @@ Parses benchmark output files into a common format for visualization.
 """
 
 import re
-import json
+import copy
+from array import array
+import mmap
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
 
 
+# Placeholder average_utilization used when CPU output had no usable data
+DEFAULT_AVERAGE_UTILIZATION = [99.0]
+
+# Single pre-pass over CPU utilization output. Run sections start at a
+# results header and end at the next "==" marker or "Creating metadata".
+_CPU_UTIL_RE = re.compile(
+    r"(?P<run>=== CPU Utilization Results \(Run: (?P<run_name>\w+)\) ===)"
+    r"|(?P<section_end>==|Creating metadata)"
+    r"|Architecture:\s*(?P<arch>.*)"
+    r"|Model name:\s*(?P<model>.*)"
+    r"|CPU Cores:\s*(?P<cores>\d+)"
+    r"|Average CPU utilization \(all cores\):\s*(?P<avg>[\d.]+)%"
+    r"|Load: (?P<load>\d+) cores"
+    r"|Duration: (?P<duration>\d+) seconds"
+)
+
+# Fallback for bare mpstat output: the trailing %idle column of timestamped
+# 'all' rows, not any "all <number>" pair elsewhere in the file
+_MPSTAT_ALL_IDLE_RE = re.compile(
+    r"^\d{2}:\d{2}:\d{2}(?:[ \t]+[AP]M)?[ \t]+all(?:[ \t]+\S+)*[ \t]+([\d.]+)[ \t]*$",
+    re.MULTILINE
+)
+
+# mpstat 'all' CPU row with at least 11 columns: time, CPU, %usr, %nice,
+# %sys, %iowait, ..., %idle (last column)
+_MPSTAT_ALL_ROW_RE = re.compile(
+    r"^(\d{2}:\d{2}:\d{2})[ \t]+all[ \t]+(\S+)[ \t]+\S+[ \t]+(\S+)[ \t]+(\S+)"
+    r"(?:[ \t]+\S+){4,}[ \t]+(\S+)[ \t]*$",
+    re.MULTILINE
+)
+
+# stress-ng run headers and their "metrc" cpu summary rows, in one pass
+# (the cpu row is matched within its own line, so a failed match never
+# backtracks across the rest of the file)
+_STRESS_RE = re.compile(
+    r"=== Running CPU test with \d+ load for \d+ seconds \(Run: (?P<run>\w+)\) ==="
+    r"|stress-ng: metrc:[^\n]*?cpu\s+(?P<bogo_ops>\d+)\s+(?P<real_time>[\d.]+)\s+(?P<usr_time>[\d.]+)"
+    r"\s+(?P<sys_time>[\d.]+)\s+(?P<bogo_ops_real>[\d.]+)\s+(?P<bogo_ops_time>[\d.]+)"
+)
+
+_GENERIC_ARCH_RE = re.compile(r"Architecture: (.*)")
+
+# "key: value" line, split at the first colon
+_KEY_VALUE_RE = re.compile(r"^([^:\n]*):(.*)$", re.MULTILINE)
+
+# One line of text, used to walk content without splitting it up front
+_LINE_RE = re.compile(r"^.*$", re.MULTILINE)
+
+# Values parse_generic turns into numbers
+_INT_RE = re.compile(r"[-+]?\d+")
+_FLOAT_RE = re.compile(r"[-+]?(?:\d+\.\d*|\.\d+)(?:[eE][-+]?\d+)?")
+
+# Files smaller than this are read into memory instead of memory-mapped
+_MMAP_MIN_SIZE = 256 * 1024
+
+# Batches need at least this many files per worker to go parallel
+_FILES_PER_WORKER = 8
+
+# Keys recognised in per-run metadata files
+_METADATA_KEYS = frozenset(("run_name", "load", "duration", "avg_utilization"))
+
+
+@contextmanager
+def _map_file(file_path):
+    """
+    Yield a buffer over the file's bytes.
+    
+    Large files are memory-mapped; small ones are read with a single
+    readinto() into an exactly sized buffer, which is cheaper than setting
+    up and tearing down a mapping.
+    """
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            yield b""
+            return
+        
+        if size < _MMAP_MIN_SIZE:
+            buf = bytearray(size)
+            view = memoryview(buf)
+            filled = 0
+            while filled < size:
+                n = f.readinto(view[filled:])
+                if not n:
+                    break
+                filled += n
+            view.release()
+            del buf[filled:]
+            yield buf
+            return
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Parsing is one front-to-back scan, so ask for aggressive readahead
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            yield mm
+
+
+def _decode(data):
+    """Decode a byte buffer to str with universal newlines, like text-mode open()."""
+    text = str(data, 'utf-8')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
 def extract_stress_metrics(content):
     """Extract stress-ng metrics from content."""
     stress_metrics_by_run = {}
     
-    # Extract run names and their corresponding metrics
-    run_names = re.findall(r'=== Running CPU test with \d+ load for \d+ seconds \(Run: (\w+)\) ===', content)
-    
-    # Extract all stress-ng metrics lines
-    metrics_pattern = r"stress-ng: metrc:.*?cpu\s+(\d+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)\s+([\d.]+)"
-    metrics_matches = re.findall(metrics_pattern, content, re.DOTALL)
-    
-    # Match metrics with run names
-    if len(metrics_matches) == len(run_names):
-        for run_name, metrics in zip(run_names, metrics_matches):
-            bogo_ops, real_time, usr_time, sys_time, bogo_ops_real, bogo_ops_time = metrics
-            stress_metrics_by_run[run_name] = {
-                "bogo_ops": int(bogo_ops),
-                "real_time": float(real_time),
-                "usr_time": float(usr_time),
-                "sys_time": float(sys_time),
-                "bogo_ops_real": float(bogo_ops_real),
-                "bogo_ops_time": float(bogo_ops_time)
+    # Attribute each metrics row to the run header before it
+    current_run = None
+    for match in _STRESS_RE.finditer(content):
+        if match.lastgroup == "run":
+            current_run = match.group("run")
+        elif current_run is not None:
+            stress_metrics_by_run[current_run] = {
+                "bogo_ops": int(match.group("bogo_ops")),
+                "real_time": float(match.group("real_time")),
+                "usr_time": float(match.group("usr_time")),
+                "sys_time": float(match.group("sys_time")),
+                "bogo_ops_real": float(match.group("bogo_ops_real")),
+                "bogo_ops_time": float(match.group("bogo_ops_time"))
             }
+            current_run = None
     
     return stress_metrics_by_run
 
@@ -42,6 +149,10 @@ def parse_file(file_path, benchmark_type):
     """
     Parse a benchmark output file based on its type.
     
+    Results are cached per process, keyed on the file's path, mtime and
+    size (and those of its raw output sibling for CPU utilization files),
+    so re-parsing an unchanged file is a dictionary lookup.
+    
     Args:
         file_path (str): Path to the output file
         benchmark_type (str): Type of benchmark (directory name)
@@ -49,124 +160,304 @@ def parse_file(file_path, benchmark_type):
     Returns:
         dict: Parsed data in common format
     """
+    file_path = str(file_path)
+    stamp = _file_stamp(file_path)
+    if benchmark_type == "100_cpu_utilization":
+        stamp += _file_stamp(_raw_output_path(file_path))
+    
+    # Callers merge into the returned dicts, so hand out a private copy
+    return copy.deepcopy(_parse_file_cached(file_path, benchmark_type, stamp))
+
+
+def _file_stamp(file_path):
+    """Return (mtime_ns, size) of a file, or (None, None) if it is missing."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return (None, None)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _raw_output_path(file_path):
+    """Return the path of the raw output file next to a result file."""
+    file_path_obj = Path(file_path)
+    instance_name = file_path_obj.name.split('__')[0]
+    return str(file_path_obj.parent / f"{instance_name}__raw_output.txt")
+
+
+@lru_cache(maxsize=256)
+def _parse_file_cached(file_path, benchmark_type, stamp):
+    """Parse a file; stamp keys the cache and supplies the file size."""
     # Common format structure
     result = {
         "benchmark_type": benchmark_type,
         "system_info": {},
         "metrics": {},
-        "raw_data": {}
+        # Where the raw output lives; reopen the file if the text is needed
+        "raw_data": {"path": file_path, "size": stamp[1] or 0}
     }
     
-    # Read file content
-    with open(file_path, 'r') as f:
-        content = f.read()
+    # Map the file and only decode the part that is actually parsed
+    with _map_file(file_path) as data:
+        content = _parsed_text(data)
+    
+    return _parse_content(content, result, file_path, benchmark_type)
+
+
+def parse_bytes(data, benchmark_type, file_path=None):
+    """
+    Parse benchmark output that is already in memory.
     
+    Unlike parse_file, the result is not cached; use this for output that
+    was just downloaded, to avoid reading it back from disk.
     
-    # Store raw data
-    result["raw_data"]["content"] = content
+    Args:
+        data (bytes): Contents of the output file
+        benchmark_type (str): Type of benchmark (directory name)
+        file_path (str): Where the output is (or will be) stored; used to
+            detect mpstat files and to find the raw output sibling
+        
+    Returns:
+        dict: Parsed data in common format
+    """
+    file_path = str(file_path) if file_path is not None else ""
+    result = {
+        "benchmark_type": benchmark_type,
+        "system_info": {},
+        "metrics": {},
+        "raw_data": {"path": file_path, "size": len(data)}
+    }
     
+    return _parse_content(_parsed_text(data), result, file_path, benchmark_type)
+
+
+def _parsed_text(data):
+    """Decode the part of an output buffer that is parsed."""
     # Check if this is a raw output file
-    if "STDOUT:" in content and "stress-ng: metrc" in content:
+    stdout_start = data.find(b"STDOUT:\n")
+    if stdout_start != -1 and data.find(b"stress-ng: metrc") != -1:
         # Extract just the STDOUT part
-        stdout_match = re.search(r"STDOUT:\n(.+?)(?:\n\n\nSTDERR:|$)", content, re.DOTALL)
-        if stdout_match:
-            stdout_content = stdout_match.group(1)
-            # Use the STDOUT content for parsing
-            content = stdout_content
+        data = _stdout_section(data, stdout_start + len(b"STDOUT:\n")) or data
     
+    return _decode(data)
+
+
+def _parse_content(content, result, file_path, benchmark_type):
+    """Dispatch decoded output to the parser for its file and benchmark type."""
     # Check if this is an mpstat file
     if "mpstat" in str(file_path).lower() or "Average:" in content:
         return parse_mpstat_file(content, result)
     
-    # Parse based on benchmark type
-    if benchmark_type == "100_cpu_utilization":
-        return parse_cpu_utilization(content, result, file_path)
-    else:
-        # Generic parser for other benchmark types
-        return parse_generic(content, result, benchmark_type)
+    # Parse based on benchmark type, generic parser for all others
+    parser = _PARSERS.get(benchmark_type, parse_generic)
+    return parser(content, result, file_path=file_path, benchmark_type=benchmark_type)
+
+
+def _stdout_section(data, start):
+    """
+    Return the STDOUT body of a raw output buffer.
+    
+    Args:
+        data: File contents
+        start (int): Offset just past the "STDOUT:" line
+        
+    Returns:
+        bytes: Text up to the blank lines before "STDERR:" (or to the end,
+        less a trailing newline), or None if the section is empty
+    """
+    size = len(data)
+    if start >= size:
+        return None
+    
+    end = data.find(b"\n\n\nSTDERR:", start + 1)
+    if end == -1:
+        end = size
+        if end - 1 > start and data[end - 1:end] == b"\n":
+            end -= 1
+    
+    return bytes(data[start:end])
+
+
+def parse_files(file_paths, benchmark_type):
+    """
+    Parse several output files of one benchmark and merge the results.
+    
+    Args:
+        file_paths (list): Paths to the output files
+        benchmark_type (str): Type of benchmark (directory name)
+        
+    Returns:
+        dict: Merged parsed data; the first file to provide a key wins,
+        except for dict values, which are merged
+    """
+    return merge_results(parse_file_batch([(path, benchmark_type) for path in file_paths]))
+
+
+def parse_file_batch(pairs):
+    """
+    Parse many files, spreading them over worker processes when there are
+    enough of them to pay for the pool start-up.
+    
+    Args:
+        pairs (list): (file_path, benchmark_type) tuples
+        
+    Returns:
+        list: Parsed data for each pair, in input order
+    """
+    pairs = [(str(path), benchmark_type) for path, benchmark_type in pairs]
+    workers = min(os.cpu_count() or 1, len(pairs) // _FILES_PER_WORKER)
+    
+    if workers < 2:
+        return [parse_file(path, benchmark_type) for path, benchmark_type in pairs]
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_parse_pair, pairs, chunksize=_FILES_PER_WORKER))
+
+
+def _parse_pair(pair):
+    """Worker entry point for parse_file_batch."""
+    return parse_file(*pair)
+
+
+def merge_results(parsed_results):
+    """
+    Merge the parsed data of several files of one benchmark.
+    
+    Args:
+        parsed_results (list): Parsed data dicts, in priority order
+        
+    Returns:
+        dict: Merged parsed data; the first file to provide a key wins,
+        except for dict values, which are merged
+    """
+    merged = {}
+    
+    for parsed in parsed_results:
+        if not parsed:
+            continue
+        
+        for key, value in parsed.items():
+            if key in merged:
+                if isinstance(merged[key], dict) and isinstance(value, dict):
+                    merged[key].update(value)
+            else:
+                merged[key] = value
+    
+    return merged
 
 
 def parse_mpstat_file(content, result):
-    """Parse mpstat output file for time-series CPU data."""
-    lines = content.strip().split('\n')
-    time_series = []
-    
-    for line in lines:
-        # Look for CPU data lines with 'all' (skip headers, averages, and individual cores)
-        if re.match(r'^\d{2}:\d{2}:\d{2}\s+all\s+', line):
-            parts = line.split()
-            if len(parts) >= 11:
-                time_str = parts[0]
-                usr = float(parts[2])     # %usr
-                sys = float(parts[4])     # %sys  
-                iowait = float(parts[5])  # %iowait
-                cpu_idle = float(parts[-1])  # %idle
-                cpu_util = 100 - cpu_idle
-                
-                time_series.append({
-                    'time': time_str,
-                    'utilization': round(cpu_util, 2),
-                    'usr': round(usr, 2),
-                    'sys': round(sys, 2),
-                    'iowait': round(iowait, 2)
-                })
-    
-    if time_series:
+    """
+    Parse mpstat output file for time-series CPU data.
+    
+    The time series is stored column-wise: a dict mapping 'time' to a list
+    of timestamps and 'utilization', 'usr', 'sys' and 'iowait' to
+    equal-length arrays of doubles.
+    """
+    time_series = {
+        'time': [],
+        'utilization': array('d'),
+        'usr': array('d'),
+        'sys': array('d'),
+        'iowait': array('d')
+    }
+    
+    # Bind the column appends once rather than looking them up per row
+    append_time = time_series['time'].append
+    append_util = time_series['utilization'].append
+    append_usr = time_series['usr'].append
+    append_sys = time_series['sys'].append
+    append_iowait = time_series['iowait'].append
+    
+    # One regex sweep picks the 'all' CPU rows (skipping headers, averages
+    # and individual cores) and captures the columns we need directly
+    for time_str, usr, sys, iowait, cpu_idle in _MPSTAT_ALL_ROW_RE.findall(content):
+        append_time(time_str)
+        append_util(round(100 - float(cpu_idle), 2))
+        append_usr(round(float(usr), 2))
+        append_sys(round(float(sys), 2))
+        append_iowait(round(float(iowait), 2))
+    
+    if time_series['time']:
         result["metrics"]["time_series"] = time_series
     
     return result
 
 
-def parse_cpu_utilization(content, result, file_path):
+def parse_cpu_utilization(content, result, file_path, benchmark_type="100_cpu_utilization"):
     """Parse CPU utilization benchmark output."""
     
     # Initialize stress metrics dictionary
     stress_metrics_by_run = {}
     
     # Check if there's a raw output file in the same directory
-    file_path_obj = Path(file_path)
-    instance_name = file_path_obj.name.split('__')[0]
-    raw_output_path = str(file_path_obj.parent / f"{instance_name}__raw_output.txt")
+    raw_output_path = _raw_output_path(file_path)
     
     # Try to extract from raw output file first
     if os.path.exists(raw_output_path):
-        with open(raw_output_path, 'r') as f:
-            raw_content = f.read()
+        with _map_file(raw_output_path) as data:
+            raw_content = _decode(data)
         stress_metrics_by_run = extract_stress_metrics(raw_content)
     
     # Also try to extract from current content if it contains stress-ng data
     if not stress_metrics_by_run and 'stress-ng: metrc' in content:
         stress_metrics_by_run = extract_stress_metrics(content)
+    
+    # Scan the content once, collecting system information and the fields
+    # of every run section; a run name seen more than once keeps the fields
+    # of its first section
+    system_info = {}
+    run_order = []
+    run_sections = {}
+    current = None
+    all_avgs = []
+    append_run = run_order.append
+    append_avg = all_avgs.append
+    
+    for match in _CPU_UTIL_RE.finditer(content):
+        kind = match.lastgroup
+        value = match.group(kind)
+        
+        if kind == "run":
+            run_name = match.group("run_name")
+            append_run(run_name)
+            current = {}
+            run_sections.setdefault(run_name, current)
+        elif kind == "section_end":
+            current = None
+        elif kind == "avg":
+            append_avg(value)
+            if current is not None:
+                current.setdefault("avg", value)
+        elif kind in ("load", "duration"):
+            if current is not None:
+                current.setdefault(kind, value)
+        else:
+            system_info.setdefault(kind, value)
+    
     # Extract system information
-    arch_match = re.search(r"Architecture:\s*(.*)", content)
-    if arch_match:
-        result["system_info"]["architecture"] = arch_match.group(1)
+    if "arch" in system_info:
+        result["system_info"]["architecture"] = system_info["arch"]
     
-    cpu_model_match = re.search(r"Model name:\s*(.*)", content)
-    if cpu_model_match:
-        result["system_info"]["cpu_model"] = cpu_model_match.group(1).strip()
+    if "model" in system_info:
+        result["system_info"]["cpu_model"] = system_info["model"].strip()
     
-    cpu_cores_match = re.search(r"CPU Cores:\s*(\d+)", content)
-    if cpu_cores_match:
-        result["system_info"]["cpu_cores"] = int(cpu_cores_match.group(1))
+    if "cores" in system_info:
+        result["system_info"]["cpu_cores"] = int(system_info["cores"])
     
     # Check if this is a metadata file
     if "run_name=" in content:
-        # Parse metadata file
-        run_name = None
-        load = None
-        duration = None
-        avg_util = None
-        
+        # Parse metadata file (key=value lines, last occurrence wins)
+        metadata = {}
         for line in content.split('\n'):
-            if line.startswith("run_name="):
-                run_name = line.split('=', 1)[1].strip()
-            elif line.startswith("load="):
-                load = line.split('=', 1)[1].strip()
-            elif line.startswith("duration="):
-                duration = line.split('=', 1)[1].strip()
-            elif line.startswith("avg_utilization="):
-                avg_util = float(line.split('=', 1)[1].strip())
+            key, sep, value = line.partition('=')
+            if sep and key in _METADATA_KEYS:
+                metadata[key] = value.strip()
+        
+        run_name = metadata.get("run_name")
+        load = metadata.get("load")
+        duration = metadata.get("duration")
+        avg_util = float(metadata["avg_utilization"]) if "avg_utilization" in metadata else None
         
         if run_name and avg_util is not None:
             if "runs" not in result["metrics"]:
@@ -196,94 +487,79 @@ def parse_cpu_utilization(content, result, file_path):
     result["metrics"]["runs"] = {}
     result["metrics"]["average_utilization"] = []
     
-    # Find all run sections
-    run_sections = re.findall(r"=== CPU Utilization Results \(Run: (\w+)\) ===.*?(?====|$)", content, re.DOTALL)
-    
-    for run_match in run_sections:
-        run_name = run_match
-        # Find the section for this run
-        run_pattern = rf"=== CPU Utilization Results \(Run: {run_name}\) ===(.*?)(?===|Creating metadata|$)"
-        run_section_match = re.search(run_pattern, content, re.DOTALL)
+    for run_name in run_order:
+        run_section = run_sections[run_name]
         
-        if run_section_match:
-            run_content = run_section_match.group(1)
+        # Extract average utilization for this run
+        if "avg" in run_section:
+            avg_util = float(run_section["avg"])
+            
+            result["metrics"]["runs"][run_name] = {
+                "avg_utilization": avg_util,
+                "load": run_section.get("load", "unknown"),
+                "duration": run_section.get("duration", "unknown")
+            }
             
-            # Extract average utilization for this run
-            avg_match = re.search(r"Average CPU utilization \(all cores\):\s*([\d.]+)%", run_content)
-            if avg_match:
-                avg_util = float(avg_match.group(1))
-                
-                # Extract load and duration
-                load_match = re.search(r"Load: (\d+) cores", run_content)
-                duration_match = re.search(r"Duration: (\d+) seconds", run_content)
-                
-                result["metrics"]["runs"][run_name] = {
-                    "avg_utilization": avg_util,
-                    "load": load_match.group(1) if load_match else "unknown",
-                    "duration": duration_match.group(1) if duration_match else "unknown"
-                }
-                
-                # Add stress-ng metrics if available for this run
-                if run_name in stress_metrics_by_run:
-                    result["metrics"]["runs"][run_name]["stress_metrics"] = stress_metrics_by_run[run_name]
-                
-                # Also add to the main average_utilization list for backward compatibility
-                result["metrics"]["average_utilization"].append(avg_util)
+            # Add stress-ng metrics if available for this run
+            if run_name in stress_metrics_by_run:
+                result["metrics"]["runs"][run_name]["stress_metrics"] = stress_metrics_by_run[run_name]
+            
+            # Also add to the main average_utilization list for backward compatibility
+            result["metrics"]["average_utilization"].append(avg_util)
     
     # Fallback to old parsing if no runs found
     if not result["metrics"]["runs"]:
-        avg_util_matches = re.findall(r"Average CPU utilization \(all cores\):\s*([\d.]+)%", content)
-        if avg_util_matches:
-            result["metrics"]["average_utilization"] = [float(util) for util in avg_util_matches]
+        if all_avgs:
+            result["metrics"]["average_utilization"] = [float(util) for util in all_avgs]
         else:
             # Try alternative format
-            avg_util_matches = re.findall(r"all\s+([\d.]+)", content)
+            avg_util_matches = _MPSTAT_ALL_IDLE_RE.findall(content)
             if avg_util_matches:
                 result["metrics"]["average_utilization"] = [100 - float(util) for util in avg_util_matches]
     
     # If still no data, set a default
     if "average_utilization" not in result["metrics"] or not result["metrics"]["average_utilization"]:
-        result["metrics"]["average_utilization"] = [99.0]  # Default to 99% utilization
-    
-    # Add raw content for debugging
-    result["raw_content"] = content
+        result["metrics"]["average_utilization"] = list(DEFAULT_AVERAGE_UTILIZATION)  # Default to 99% utilization
     
     return result
 
 
-def parse_generic(content, result, benchmark_type):
+def parse_generic(content, result, benchmark_type, file_path=None):
     """Generic parser for other benchmark types."""
     # Extract system information if available
-    arch_match = re.search(r"Architecture: (.*)", content)
+    arch_match = _GENERIC_ARCH_RE.search(content)
     if arch_match:
         result["system_info"]["architecture"] = arch_match.group(1)
     
     # Try to extract common metrics based on patterns
-    # Look for lines with metric: value format
-    for line in content.split('\n'):
-        if ':' in line:
-            parts = line.split(':', 1)
-            if len(parts) == 2:
-                key = parts[0].strip().lower().replace(' ', '_')
-                value = parts[1].strip()
-                
-                # Try to convert to number if possible
-                try:
-                    if '.' in value:
-                        value = float(value)
-                    else:
-                        value = int(value)
-                except ValueError:
-                    pass
-                
-                result["metrics"][key] = value
-    
-    # Look for tabular data
+    # Look for lines with metric: value format, letting the regex skip
+    # every line without a colon
+    for key, value in _KEY_VALUE_RE.findall(content):
+        key = key.strip().lower().replace(' ', '_')
+        value = value.strip()
+        
+        # Convert to number if it looks like one; most values are text, so
+        # check the shape first instead of raising and catching ValueError
+        if '.' in value:
+            if _FLOAT_RE.fullmatch(value):
+                value = float(value)
+        elif _INT_RE.fullmatch(value):
+            value = int(value)
+        
+        result["metrics"][key] = value
+    
+    # Look for tabular data; a table needs a "-+-" separator line, so
+    # skip the scan entirely without one and otherwise start at its line
+    separator = content.find('-+-')
+    if separator == -1:
+        return result
+    
     tables = []
     current_table = []
     in_table = False
     
-    for line in content.split('\n'):
+    for match in _LINE_RE.finditer(content, content.rfind('\n', 0, separator) + 1):
+        line = match.group()
         if '|' in line and '-+-' in line:
             # Table separator line
             in_table = True
@@ -307,4 +583,11 @@ def parse_generic(content, result, benchmark_type):
     if tables:
         result["metrics"]["tables"] = tables
     
-    return result
\ No newline at end of file
+    return result
+
+
+# Benchmark-specific parsers by benchmark type (directory name); every
+# parser accepts file_path and benchmark_type as keyword arguments
+_PARSERS = {
+    "100_cpu_utilization": parse_cpu_utilization,
+}
@@ -1,14 +1,16 @@
 #!/usr/bin/env python3
 """Optimized data processing utilities with streaming and validation."""
 
+import os
 import json
+from collections import OrderedDict
 from pathlib import Path
-from typing import Iterator, Dict, Any, Optional
+from typing import Iterator, Dict, Any, Hashable, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BenchmarkResult:
     """Validated benchmark result data structure."""
     instance_name: str
@@ -35,6 +37,10 @@ class StreamingParser:
         if not file_path.exists():
             return
         
+        # One timestamp per file, and one object per distinct record
+        timestamp = datetime.now()
+        created: Dict[Tuple[str, str, str], BenchmarkResult] = {}
+        
         try:
             with open(file_path, 'r') as f:
                 current_result = {}
@@ -52,7 +58,7 @@ class StreamingParser:
                         
                         # Check if we have a complete result
                         if StreamingParser._is_complete_result(current_result):
-                            result = StreamingParser._create_benchmark_result(current_result)
+                            result = StreamingParser._create_benchmark_result(current_result, timestamp, created)
                             if result:
                                 yield result
                             current_result = {}
@@ -64,7 +70,7 @@ class StreamingParser:
                 
                 # Handle any remaining result
                 if current_result and StreamingParser._is_complete_result(current_result):
-                    result = StreamingParser._create_benchmark_result(current_result)
+                    result = StreamingParser._create_benchmark_result(current_result, timestamp, created)
                     if result:
                         yield result
         
@@ -78,53 +84,75 @@ class StreamingParser:
         return all(field in result for field in required_fields)
     
     @staticmethod
-    def _create_benchmark_result(data: Dict[str, Any]) -> Optional[BenchmarkResult]:
-        """Create BenchmarkResult from parsed data."""
+    def _create_benchmark_result(data: Dict[str, Any], timestamp: Optional[datetime] = None,
+                                 created: Optional[Dict[Tuple[str, str, str], BenchmarkResult]] = None
+                                 ) -> Optional[BenchmarkResult]:
+        """Create BenchmarkResult from parsed data.
+        
+        If created is given, identical records reuse the BenchmarkResult
+        already built for them.
+        """
+        key = (data.get('instance_name', ''), data.get('benchmark_type', ''), repr(data.get('metrics', {})))
+        if created is not None and key in created:
+            return created[key]
+        
         try:
-            return BenchmarkResult(
+            result = BenchmarkResult(
                 instance_name=data.get('instance_name', ''),
                 benchmark_type=data.get('benchmark_type', ''),
                 metrics=data.get('metrics', {}),
-                timestamp=datetime.now()
+                timestamp=timestamp or datetime.now()
             )
         except ValueError as e:
             print(f"Warning: Invalid result data: {e}")
             return None
+        
+        if created is not None:
+            created[key] = result
+        return result
+
+
+def _iter_txt_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for all .txt files below root."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.txt') and entry.is_file():
+                    yield entry
 
 
 class ResultCache:
     """Simple in-memory cache for parsed results."""
     
     def __init__(self, max_size: int = 1000):
-        self.cache: Dict[str, Any] = {}
+        # Ordered least to most recently used
+        self.cache: "OrderedDict[Hashable, Any]" = OrderedDict()
         self.max_size = max_size
-        self.access_order = []
     
-    def get(self, key: str) -> Optional[Any]:
+    def get(self, key: Hashable) -> Optional[Any]:
         """Get cached result."""
         if key in self.cache:
             # Move to end (most recently used)
-            self.access_order.remove(key)
-            self.access_order.append(key)
+            self.cache.move_to_end(key)
             return self.cache[key]
         return None
     
-    def put(self, key: str, value: Any):
+    def put(self, key: Hashable, value: Any):
         """Cache result with LRU eviction."""
         if key in self.cache:
-            self.access_order.remove(key)
+            self.cache.move_to_end(key)
         elif len(self.cache) >= self.max_size:
             # Evict least recently used
-            oldest = self.access_order.pop(0)
-            del self.cache[oldest]
+            self.cache.popitem(last=False)
         
         self.cache[key] = value
-        self.access_order.append(key)
     
     def clear(self):
         """Clear cache."""
         self.cache.clear()
-        self.access_order.clear()
 
 
 class DataProcessor:
@@ -134,13 +162,20 @@ class DataProcessor:
         self.cache = ResultCache(cache_size)
         self.parser = StreamingParser()
     
+    @staticmethod
+    def _cache_key(file_path: Path) -> Tuple[int, int, int, int]:
+        """Cache key identifying a file's current contents."""
+        st = file_path.stat()
+        return (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+    
     def process_file(self, file_path: Path, force_refresh: bool = False) -> Iterator[BenchmarkResult]:
         """Process file with caching."""
-        cache_key = f"{file_path}:{file_path.stat().st_mtime}"
+        cache_key = self._cache_key(file_path)
         
         if not force_refresh:
             cached = self.cache.get(cache_key)
-            if cached:
+            # Files that parse to no results cache as [], which is still a hit
+            if cached is not None:
                 yield from cached
                 return
         
@@ -153,20 +188,19 @@ class DataProcessor:
         """Process entire directory efficiently."""
         results = {}
         
-        for file_path in dir_path.rglob("*.txt"):
-            if file_path.is_file():
-                file_results = list(self.process_file(file_path))
-                if file_results:
-                    # Group by instance and benchmark
-                    for result in file_results:
-                        instance_key = result.instance_name
-                        benchmark_key = result.benchmark_type
-                        
-                        if instance_key not in results:
-                            results[instance_key] = {}
-                        if benchmark_key not in results[instance_key]:
-                            results[instance_key][benchmark_key] = []
-                        
-                        results[instance_key][benchmark_key].append(result)
+        for entry in _iter_txt_files(dir_path):
+            file_results = list(self.process_file(Path(entry.path)))
+            if file_results:
+                # Group by instance and benchmark
+                for result in file_results:
+                    instance_key = result.instance_name
+                    benchmark_key = result.benchmark_type
+                    
+                    if instance_key not in results:
+                        results[instance_key] = {}
+                    if benchmark_key not in results[instance_key]:
+                        results[instance_key][benchmark_key] = []
+                    
+                    results[instance_key][benchmark_key].append(result)
         
         return results
\ No newline at end of file
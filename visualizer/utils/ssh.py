@@ -2,11 +2,34 @@
 """SSH utilities for remote command execution."""
 
 import os
+import asyncio
+import functools
+import sys
+import time
+import selectors
 import subprocess
-import threading
 from typing import Tuple, Optional
 from termcolor import colored
-from datetime import datetime
+
+# Master connection socket; %C is a hash of local host, remote host, port
+# and user, which keeps the path short and unique per target
+CONTROL_PATH = "/tmp/bench-ssh-%C"
+
+# Options that let every command to an instance reuse one authenticated
+# connection; the master stays up for 10 minutes after the last command
+SSH_MUX_OPTIONS = [
+    "-o", "ControlMaster=auto",
+    "-o", f"ControlPath={CONTROL_PATH}",
+    "-o", "ControlPersist=600",
+]
+
+
+def fnv1a(data: bytes) -> int:
+    """64-bit FNV-1a hash; unlike hash(), stable across processes."""
+    h = 0xcbf29ce484222325
+    for byte in data:
+        h = ((h ^ byte) * 0x100000001b3) & 0xffffffffffffffff
+    return h
 
 
 class SSHClient:
@@ -14,35 +37,62 @@ class SSHClient:
     
     def __init__(self, instance: dict, colors: list):
         self.instance = instance
-        self.color = colors[hash(instance['name']) % len(colors)]
+        self.color = colors[fnv1a(instance['name'].encode()) % len(colors)]
         self.prefix = f"[{instance['name']}] "
+        # Colored line prefixes, built once rather than per output line
+        self._colored_prefix = colored(self.prefix, self.color)
+        self._colored_err_prefix = colored(f"[{instance['name']}-ERR] ", self.color)
+        self._ssh_base = self._build_ssh_base()
     
-    def run_command(self, command: str, capture_output: bool = False) -> Tuple[int, str, str]:
-        """Execute SSH command on remote instance."""
-        ssh_cmd = self._build_ssh_command(command)
+    def run_command(self, command: str, capture_output: bool = False,
+                    binary: bool = False, cwd: Optional[str] = None) -> Tuple[int, str, str]:
+        """Execute SSH command on remote instance.
+        
+        With binary=True the captured stdout/stderr are returned as bytes.
+        If cwd is given the command runs in that remote directory.
+        """
+        ssh_cmd = self._build_ssh_command(command, cwd)
         
         if capture_output:
-            result = subprocess.run(ssh_cmd, capture_output=True, text=True)
+            result = subprocess.run(ssh_cmd, capture_output=True, text=not binary)
             return result.returncode, result.stdout, result.stderr
         else:
             return self._run_with_output(ssh_cmd)
     
-    def _build_ssh_command(self, command: str) -> list:
+    async def run_command_async(self, command: str, capture_output: bool = False,
+                                binary: bool = False, cwd: Optional[str] = None):
+        """Execute SSH command without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.run_command, command, capture_output=capture_output,
+                                    binary=binary, cwd=cwd)
+        )
+    
+    def close(self):
+        """Shut down the shared master connection, if one is running."""
+        subprocess.run(self._ssh_base[:-1] + ["-O", "exit", self._ssh_base[-1]],
+                       capture_output=True)
+    
+    def _build_ssh_command(self, command: str, cwd: Optional[str] = None) -> list:
         """Build SSH command with proper options."""
+        if cwd:
+            command = f"cd {cwd} && {command}"
+        return self._ssh_base + [command]
+    
+    def _build_ssh_base(self) -> list:
+        """Build the static part of the SSH command (options and target)."""
         ssh_cmd = [
             "ssh",
             "-o", "StrictHostKeyChecking=accept-new",
             "-o", "ConnectTimeout=10",
+            *SSH_MUX_OPTIONS,
         ]
         
         ssh_key = os.environ.get("SSH_KEY_PATH")
         if ssh_key:
             ssh_cmd.extend(["-i", ssh_key])
         
-        ssh_cmd.extend([
-            f"{self.instance['username']}@{self.instance['ip']}",
-            command
-        ])
+        ssh_cmd.append(f"{self.instance['username']}@{self.instance['ip']}")
         
         return ssh_cmd
     
@@ -51,27 +101,60 @@ class SSHClient:
         process = subprocess.Popen(
             ssh_cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
+            stderr=subprocess.PIPE
         )
         
-        def print_output(pipe, is_stderr=False):
-            prefix = f"[{self.instance['name']}-ERR] " if is_stderr else self.prefix
-            for line in pipe:
-                if line.strip():
-                    timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-                    print(f"[{timestamp}] " + colored(prefix, self.color) + line.strip())
-        
-        stdout_thread = threading.Thread(target=print_output, args=(process.stdout,))
-        stderr_thread = threading.Thread(target=print_output, args=(process.stderr, True))
+        # Drain both pipes from this thread, printing complete lines as
+        # they arrive; the registered data is the pipe's line prefix
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ, self._colored_prefix)
+        selector.register(process.stderr, selectors.EVENT_READ, self._colored_err_prefix)
+        pending = {process.stdout: b"", process.stderr: b""}
         
-        stdout_thread.start()
-        stderr_thread.start()
+        while selector.get_map():
+            out = []
+            for key, _ in selector.select():
+                pipe, prefix = key.fileobj, key.data
+                chunk = os.read(pipe.fileno(), 65536)
+                
+                if chunk:
+                    *lines, pending[pipe] = (pending[pipe] + chunk).split(b"\n")
+                else:
+                    # EOF: flush any unterminated last line
+                    selector.unregister(pipe)
+                    lines, pending[pipe] = [pending[pipe]], b""
+                
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        out.append(self._format_line(prefix, line.decode(errors="replace")))
+            
+            # One write per wakeup rather than one per line
+            if out:
+                self._write_stdout("".join(out))
         
-        exit_code = process.wait()
-        
-        stdout_thread.join()
-        stderr_thread.join()
+        selector.close()
+        return process.wait()
+    
+    @staticmethod
+    def _format_line(colored_prefix: str, line: str) -> str:
+        """Format one output line with a timestamp and colored prefix."""
+        now = time.time()
+        timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+        return f"[{timestamp}.{int(now % 1 * 1000):03d}] {colored_prefix}{line}\n"
+    
+    @staticmethod
+    def _write_stdout(text: str):
+        """Write text straight to the stdout file descriptor."""
+        try:
+            fd = sys.stdout.fileno()
+        except (AttributeError, OSError, ValueError):
+            # Not backed by a real file (e.g. captured output)
+            sys.stdout.write(text)
+            return
         
-        return exit_code
\ No newline at end of file
+        # Keep ordering with anything already buffered by print()
+        sys.stdout.flush()
+        data = memoryview(text.encode())
+        while data:
+            data = data[os.write(fd, data):]
@@ -6,15 +6,22 @@ This tool runs benchmarks on remote VMs and visualizes the results.
 """
 
 import os
+import re
 import sys
 import json
+import fcntl
+import shlex
+import hashlib
+import shutil
+import tarfile
+import functools
+import time
 import argparse
+import selectors
 import subprocess
 import threading
-import tempfile
 import webbrowser
 from pathlib import Path
-import boto3
 import concurrent.futures
 from datetime import datetime
 from termcolor import colored
@@ -23,11 +30,17 @@ from termcolor import colored
 from cloud_providers import aws_provider
 from parsers import parse_benchmark_output
 from visualizers import generate_html_report
+from utils.ssh import SSH_MUX_OPTIONS, fnv1a
 
 # Constants
 REPO_URL = "https://github.com/geremyCohen/bench_guide"
+REQUIRED_PACKAGES = "git build-essential"
+REPO_CACHE_DIR = "~/benchmarks/bench_guide_cache"
+REPO_CACHE_LOCK = "~/benchmarks/.bench_guide_cache.lock"
 RESULTS_DIR = Path(__file__).parent / "results"
 LAZY_RELOAD = 0  # Set to True to skip remote execution and reprocess last results
+USE_RESULT_CACHE = False  # Reuse results of benchmarks already run at the same commit (--cache)
+RESULT_CACHE_DIR = RESULTS_DIR / ".cache"
 
 # Ensure results directory exists
 RESULTS_DIR.mkdir(exist_ok=True)
@@ -61,23 +74,62 @@ else:
 # Define colors for different instances
 INSTANCE_COLORS = ['green', 'yellow', 'blue', 'magenta', 'cyan']
 
+# Benchmarks from every instance run on one shared pool; each instance
+# keeps at most MAX_BENCHMARKS_PER_INSTANCE of them in flight
+BENCHMARK_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4))
+MAX_BENCHMARKS_PER_INSTANCE = 4
+
+# Kernel buffer size requested for pipes carrying remote output
+PIPE_SIZE = 1 << 20
+
+# Benchmark directories are named <number>_<name>
+_BENCHMARK_DIR_RE = re.compile(r"^(\d+)_(.*)$")
+
+# One entry of outputs_info.txt: a non-blank line, without surrounding spaces
+_OUTPUT_NAME_RE = re.compile(r"\S+(?:[ \t]+\S+)*")
+
+# Markers separating the parts of the combined benchmark command's output
+SCRIPT_MARKER = "===BENCHMARK_SCRIPT==="
+OUTPUTS_MARKER = "===OUTPUTS_INFO==="
+
+# Files the benchmark script's stdout and stderr are redirected to on the remote
+STDOUT_FILE = ".bench_stdout"
+STDERR_FILE = ".bench_stderr"
+
+# Options for every ssh call, including the shared connection settings
+SSH_OPTIONS = [
+    "-o", "StrictHostKeyChecking=accept-new",  # Accept new hosts automatically
+    "-o", "ConnectTimeout=10",  # Timeout after 10 seconds
+] + SSH_MUX_OPTIONS
+
+
+# (second, "H:M:S") of the last timestamp, so strftime runs once a second
+_timestamp_second = (None, "")
+
 
 def get_timestamp():
     """Get current timestamp in H:M:S.ms format."""
-    return datetime.now().strftime("%H:%M:%S.%f")[:-3]
+    global _timestamp_second
+    now = time.time()
+    second = int(now)
+    cached_second, hms = _timestamp_second
+    if second != cached_second:
+        hms = time.strftime("%H:%M:%S", time.localtime(second))
+        _timestamp_second = (second, hms)
+    return f"{hms}.{int((now - second) * 1000):03d}"
 
 
-def run_ssh_command(instance, command, capture_output=False):
-    """Run command on remote instance using system SSH."""
-    color_idx = hash(instance['name']) % len(INSTANCE_COLORS)
-    color = INSTANCE_COLORS[color_idx]
-    prefix = f"[{instance['name']}] "
-    
-    ssh_cmd = [
-        "ssh",
-        "-o", "StrictHostKeyChecking=accept-new",  # Accept new hosts automatically
-        "-o", "ConnectTimeout=10",  # Timeout after 10 seconds
-    ]
+def set_instance_style(instance):
+    """Store the instance's log color and colored prefixes on the instance."""
+    color = INSTANCE_COLORS[fnv1a(instance['name'].encode()) % len(INSTANCE_COLORS)]
+    instance['_color'] = color
+    instance['_prefix'] = colored(f"[{instance['name']}]", color)
+    instance['_err_prefix'] = colored(f"[{instance['name']}-ERR]", color)
+
+
+def build_ssh_command(instance, command):
+    """Build the ssh argument list for running command on an instance."""
+    ssh_cmd = ["ssh"] + SSH_OPTIONS
     
     # Add identity file if specified
     ssh_key = os.environ.get("SSH_KEY_PATH")
@@ -89,6 +141,22 @@ def run_ssh_command(instance, command, capture_output=False):
         f"{instance['username']}@{instance['ip']}",
         command
     ])
+    return ssh_cmd
+
+
+def enlarge_pipe(pipe):
+    """Grow a pipe's kernel buffer so ssh blocks less on bursts of output (Linux only)."""
+    if hasattr(fcntl, "F_SETPIPE_SZ"):
+        try:
+            fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_SIZE)
+        except OSError:
+            # Above /proc/sys/fs/pipe-max-size; keep the default size
+            pass
+
+
+def run_ssh_command(instance, command, capture_output=False):
+    """Run command on remote instance using system SSH."""
+    ssh_cmd = build_ssh_command(instance, command)
     
     if capture_output:
         result = subprocess.run(ssh_cmd, capture_output=True, text=True)
@@ -98,58 +166,75 @@ def run_ssh_command(instance, command, capture_output=False):
         process = subprocess.Popen(
             ssh_cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            bufsize=1
+            stderr=subprocess.PIPE
         )
         
-        def print_output(pipe, is_stderr=False):
-            prefix_text = prefix
-            if is_stderr:
-                prefix_text = f"[{instance['name']}-ERR] "
-            for line in pipe:
-                if line.strip():
-                    timestamp = get_timestamp()
-                    print(f"[{timestamp}] " + colored(prefix_text, color) + line.strip())
+        enlarge_pipe(process.stdout)
+        enlarge_pipe(process.stderr)
         
-        # Start threads to handle stdout and stderr
-        stdout_thread = threading.Thread(target=print_output, args=(process.stdout,))
-        stderr_thread = threading.Thread(target=print_output, args=(process.stderr, True))
+        # Drain both pipes from this thread, printing complete lines as
+        # they arrive; the registered data is the pipe's line prefix
+        selector = selectors.DefaultSelector()
+        selector.register(process.stdout, selectors.EVENT_READ, instance['_prefix'])
+        selector.register(process.stderr, selectors.EVENT_READ, instance['_err_prefix'])
+        pending = {process.stdout: b"", process.stderr: b""}
         
-        stdout_thread.start()
-        stderr_thread.start()
+        while selector.get_map():
+            out = []
+            for key, _ in selector.select():
+                pipe, prefix_text = key.fileobj, key.data
+                chunk = os.read(pipe.fileno(), 65536)
+                
+                if chunk:
+                    *lines, pending[pipe] = (pending[pipe] + chunk).split(b"\n")
+                else:
+                    # EOF: flush any unterminated last line
+                    selector.unregister(pipe)
+                    lines, pending[pipe] = [pending[pipe]], b""
+                
+                # One timestamp for every line in this read
+                line_prefix = f"[{get_timestamp()}] {prefix_text} "
+                for line in lines:
+                    line = line.strip()
+                    if line:
+                        out.append(f"{line_prefix}{line.decode(errors='replace')}\n")
+            
+            # One write and flush per wakeup rather than a print per line
+            if out:
+                sys.stdout.write("".join(out))
+                sys.stdout.flush()
         
-        # Wait for process to complete
+        selector.close()
         exit_code = process.wait()
         
-        # Wait for threads to finish
-        stdout_thread.join()
-        stderr_thread.join()
-        
         return exit_code
 
 
-def get_benchmarks():
-    """Get list of available benchmarks from the repo structure."""
+@functools.lru_cache(maxsize=1)
+def scan_benchmarks():
+    """Scan the repo for benchmarks once; returns (benchmarks, {path: index})."""
     benchmarks = []
     base_dir = Path(__file__).parent.parent
     
-    for item in base_dir.iterdir():
-        if item.is_dir() and item.name[0].isdigit() and "_" in item.name:
-            # Extract number and name
-            parts = item.name.split("_", 1)
-            if len(parts) == 2 and parts[0].isdigit():
-                number = parts[0]
-                name = parts[1]
+    with os.scandir(base_dir) as entries:
+        for entry in entries:
+            # Benchmark directories are named <number>_<name>
+            match = _BENCHMARK_DIR_RE.match(entry.name)
+            if match and entry.is_dir():
                 benchmarks.append({
-                    "number": number,
-                    "name": name,
-                    "path": item.name
+                    "number": match.group(1),
+                    "name": match.group(2),
+                    "path": entry.name
                 })
     
     # Sort by benchmark number
     benchmarks.sort(key=lambda x: int(x["number"]))
-    return benchmarks
+    return benchmarks, {benchmark["path"]: i for i, benchmark in enumerate(benchmarks)}
+
+
+def get_benchmarks():
+    """Get list of available benchmarks from the repo structure."""
+    return list(scan_benchmarks()[0])
 
 
 def select_cloud_provider():
@@ -170,90 +255,135 @@ def select_cloud_provider():
         return "aws"
 
 
-def select_benchmarks():
-    """Let user select benchmarks to run."""
-    benchmarks = get_benchmarks()
+def select_benchmarks(selection=None):
+    """Let user select benchmarks to run, unless a selection is given."""
+    benchmarks, benchmark_index = scan_benchmarks()
     
-    timestamp = get_timestamp()
-    print(f"\n[{timestamp}] Available benchmarks:")
-    for i, benchmark in enumerate(benchmarks, 1):
-        print(f"[{get_timestamp()}] {i}. {benchmark['path']} - {benchmark['name']}")
-    
-    # Find the index of 100_cpu_utilization for default selection
-    default_benchmark_idx = 0
-    for i, benchmark in enumerate(benchmarks):
-        if benchmark['path'] == '100_cpu_utilization':
-            default_benchmark_idx = i
-            break
+    if selection is None:
+        timestamp = get_timestamp()
+        print(f"\n[{timestamp}] Available benchmarks:")
+        for i, benchmark in enumerate(benchmarks, 1):
+            print(f"[{get_timestamp()}] {i}. {benchmark['path']} - {benchmark['name']}")
+        
+        timestamp = get_timestamp()
+        print(f"\n[{timestamp}] Enter benchmark numbers to run (comma-separated, or 'all') [100_cpu_utilization]:")
+        selection = input(f"[{get_timestamp()}] > ")
+    selection = selection.strip()
     
-    timestamp = get_timestamp()
-    print(f"\n[{timestamp}] Enter benchmark numbers to run (comma-separated, or 'all') [100_cpu_utilization]:")
-    selection = input(f"[{get_timestamp()}] > ").strip()
+    # Default selection is 100_cpu_utilization
+    default_benchmark_idx = benchmark_index.get('100_cpu_utilization', 0)
     
     if selection.lower() == "all":
-        return benchmarks
+        return list(benchmarks)
     elif not selection:  # Default to 100_cpu_utilization if no input
         return [benchmarks[default_benchmark_idx]] if default_benchmark_idx < len(benchmarks) else []
     
-    selected_indices = [int(idx.strip()) - 1 for idx in selection.split(",") if idx.strip().isdigit()]
+    # Entries are 1-based numbers from the list or benchmark directory names
+    selected_indices = []
+    for item in selection.split(","):
+        item = item.strip()
+        if item.isdigit():
+            selected_indices.append(int(item) - 1)
+        elif item in benchmark_index:
+            selected_indices.append(benchmark_index[item])
     return [benchmarks[idx] for idx in selected_indices if 0 <= idx < len(benchmarks)]
 
 
+def select_instances(instances, selection):
+    """Pick instances from a comma-separated list of 1-based numbers or 'all'."""
+    selection = selection.strip()
+    
+    if selection.lower() == "all":
+        return instances
+    elif not selection:  # Default to first two instances if no input
+        default_indices = [0, 1]  # 0-based indices for instances 1 and 2
+        return [instances[idx] for idx in default_indices if 0 <= idx < len(instances)]
+    
+    selected_indices = [int(idx.strip()) - 1 for idx in selection.split(",") if idx.strip().isdigit()]
+    return [instances[idx] for idx in selected_indices if 0 <= idx < len(instances)]
+
+
+def parse_args():
+    """Parse command line flags; any selection left out is asked for interactively."""
+    parser = argparse.ArgumentParser(description="Benchmark Visualizer Tool")
+    parser.add_argument(
+        "--provider",
+        choices=["aws"],
+        help="Cloud provider to use (default: aws)"
+    )
+    parser.add_argument(
+        "--instances",
+        help="Instance numbers to use (comma-separated, or 'all')"
+    )
+    parser.add_argument(
+        "--benchmarks",
+        help="Benchmark numbers or directory names to run (comma-separated, or 'all')"
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse results of benchmarks that already ran successfully at the same commit"
+    )
+    return parser.parse_args()
+
+
+def _merge_parsed(parsed_data, run_data):
+    """Merge one parsed file's metrics and system info into parsed_data."""
+    if not run_data or "metrics" not in run_data:
+        return
+    
+    # Merge metrics; the first file to provide a key wins, except runs
+    for key, value in run_data["metrics"].items():
+        if key not in parsed_data["metrics"]:
+            parsed_data["metrics"][key] = value
+        elif key == "runs" and isinstance(value, dict):
+            parsed_data["metrics"]["runs"].update(value)
+    
+    # Merge system info
+    if "system_info" in run_data:
+        parsed_data["system_info"].update(run_data["system_info"])
+
+
 def run_single_benchmark(instance, benchmark, benchmark_output_dir, temp_dir):
-    """Run a single benchmark and collect results."""
+    """Run a single benchmark and collect results.
+    
+    Returns (parsed_data, complete), where complete is True only if the
+    script exited 0 and every output file was downloaded.
+    """
     benchmark_dir = benchmark["path"]
-    color_idx = hash(instance['name']) % len(INSTANCE_COLORS)
-    color = INSTANCE_COLORS[color_idx]
     
-    # Check which benchmark script exists
+    # Pick the script, run it and read outputs_info.txt in one round trip;
+    # the remote shell reports the chosen script on the first line and
+    # marks where the outputs manifest starts. The script's own output
+    # goes to files on the remote and comes back with the tar fetch below
+    timestamp = get_timestamp()
+    print(f"[{timestamp}] " + instance['_prefix'] + f" Running benchmark script in {benchmark_dir}...")
     exit_code, stdout, stderr = run_ssh_command(
         instance,
-        f"cd ~/benchmarks/{temp_dir}/bench_guide/{benchmark_dir} && ls -la *.sh",
+        f"cd ~/benchmarks/{temp_dir}/bench_guide/{benchmark_dir} && "
+        f"{{ for s in cpu_benchmark.sh benchmark.sh $(ls *.sh 2>/dev/null) benchmark.sh; do [ -f \"$s\" ] && break; done; "
+        f"echo \"{SCRIPT_MARKER} $s\"; chmod +x \"$s\" && ./\"$s\" >{STDOUT_FILE} 2>{STDERR_FILE}; rc=$?; "
+        f"printf '%s\\n' '{OUTPUTS_MARKER}'; cat outputs_info.txt 2>/dev/null; exit $rc; }}",
         capture_output=True
     )
     
-    if "cpu_benchmark.sh" in stdout:
-        benchmark_script = "cpu_benchmark.sh"
-    elif "benchmark.sh" in stdout:
-        benchmark_script = "benchmark.sh"
-    else:
-        # Find any .sh file
-        benchmark_script = "benchmark.sh"  # Default fallback
-        for line in stdout.splitlines():
-            if line.endswith(".sh"):
-                parts = line.split()
-                if len(parts) > 0:
-                    benchmark_script = parts[-1]
-                    break
-    
-    # Run benchmark script
+    benchmark_script = "benchmark.sh"
+    if stdout.startswith(SCRIPT_MARKER):
+        script_line, _, stdout = stdout.partition("\n")
+        benchmark_script = script_line[len(SCRIPT_MARKER):].strip() or benchmark_script
+    
+    outputs_info = ""
+    if f"{OUTPUTS_MARKER}\n" in stdout:
+        _, _, outputs_info = stdout.partition(f"{OUTPUTS_MARKER}\n")
+    
     timestamp = get_timestamp()
-    print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + f" Running {benchmark_script} in {benchmark_dir}...")
-    exit_code, stdout, stderr = run_ssh_command(
-        instance,
-        f"cd ~/benchmarks/{temp_dir}/bench_guide/{benchmark_dir} && chmod +x {benchmark_script} && ./{benchmark_script}",
-        capture_output=True
-    )
+    print(f"[{timestamp}] " + instance['_prefix'] + f" Ran {benchmark_script} in {benchmark_dir}")
     if exit_code != 0:
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Benchmark script failed with exit code {exit_code}")
-    
-    # Save raw output for debugging
-    raw_output_path = benchmark_output_dir / f"{instance['name']}__raw_output.txt"
-    with open(raw_output_path, 'w') as f:
-        f.write(f"STDOUT:\n{stdout}\n\nSTDERR:\n{stderr}")
-    timestamp = get_timestamp()
-    print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + f" Saved raw output to {raw_output_path}")
+        print(f"[{timestamp}] " + instance['_err_prefix'] + f" Benchmark script failed with exit code {exit_code}")
     
-    # Check for outputs_info.txt
-    exit_code, stdout, stderr = run_ssh_command(
-        instance,
-        f"cat ~/benchmarks/{temp_dir}/bench_guide/{benchmark_dir}/outputs_info.txt 2>/dev/null || echo ''",
-        capture_output=True
-    )
-    
-    if stdout.strip():
-        output_files = [line.strip() for line in stdout.splitlines() if line.strip()]
+    if outputs_info.strip():
+        output_files = _OUTPUT_NAME_RE.findall(outputs_info)
     else:
         # Default to common output files if outputs_info.txt doesn't exist
         if benchmark_dir == "100_cpu_utilization":
@@ -261,38 +391,67 @@ def run_single_benchmark(instance, benchmark, benchmark_output_dir, temp_dir):
         else:
             output_files = ["benchmark_results.txt"]
     
-    # Download output files
+    # Download the script's stdout/stderr and all output files in a single
+    # tar stream over SSH, extracting members as they arrive
     parsed_data = None
     downloaded_files = []
+    raw_output_path = benchmark_output_dir / f"{instance['name']}__raw_output.txt"
+    
+    remote_names = " ".join(shlex.quote(name) for name in [STDOUT_FILE, STDERR_FILE] + output_files)
+    process = subprocess.Popen(
+        build_ssh_command(
+            instance,
+            f"cd ~/benchmarks/{temp_dir}/bench_guide/{benchmark_dir} && "
+            f"tar cf - --ignore-failed-read -- {remote_names} 2>/dev/null"
+        ),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    enlarge_pipe(process.stdout)
+    
+    fetched = set()
+    contents = {}
+    # Raw output for debugging is assembled from the two streams; tar keeps
+    # the argument order, so stdout arrives before stderr
+    with open(raw_output_path, 'wb') as raw:
+        raw.write(b"STDOUT:\n")
+        try:
+            with tarfile.open(fileobj=process.stdout, mode='r|') as tar:
+                for member in tar:
+                    if not member.isfile():
+                        continue
+                    if member.name in (STDOUT_FILE, STDERR_FILE):
+                        if member.name == STDERR_FILE:
+                            raw.write(b"\n\nSTDERR:\n")
+                        shutil.copyfileobj(tar.extractfile(member), raw)
+                        fetched.add(member.name)
+                    elif member.name in output_files:
+                        # Only take the files that were asked for, under our own
+                        # names; keep the bytes so parsing need not reread them
+                        local_path = benchmark_output_dir / f"{instance['name']}__{member.name}"
+                        with tar.extractfile(member) as src:
+                            contents[local_path] = src.read()
+                        local_path.write_bytes(contents[local_path])
+                        fetched.add(member.name)
+        except tarfile.TarError:
+            pass
+        if STDERR_FILE not in fetched:
+            raw.write(b"\n\nSTDERR:\n")
+            raw.write(stderr.encode())
+    process.stdout.close()
+    process.wait()
+    
+    timestamp = get_timestamp()
+    print(f"[{timestamp}] " + instance['_prefix'] + f" Saved raw output to {raw_output_path}")
     
     for output_file in output_files:
-        local_path = benchmark_output_dir / f"{instance['name']}__{output_file}"
-        
-        # Use scp to download the file
-        scp_cmd = [
-            "scp",
-            "-o", "StrictHostKeyChecking=accept-new",
-        ]
-        
-        # Add identity file if specified
-        ssh_key = os.environ.get("SSH_KEY_PATH")
-        if ssh_key:
-            scp_cmd.extend(["-i", ssh_key])
-        
-        scp_cmd.extend([
-            f"{instance['username']}@{instance['ip']}:~/benchmarks/{temp_dir}/bench_guide/{benchmark_dir}/{output_file}",
-            str(local_path)
-        ])
-        
-        result = subprocess.run(scp_cmd, capture_output=True)
-        
-        if result.returncode == 0:
+        if output_file in fetched:
             timestamp = get_timestamp()
-            print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + f" Downloaded {output_file}")
-            downloaded_files.append(local_path)
+            print(f"[{timestamp}] " + instance['_prefix'] + f" Downloaded {output_file}")
+            downloaded_files.append(benchmark_output_dir / f"{instance['name']}__{output_file}")
         else:
             timestamp = get_timestamp()
-            print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Failed to download {output_file}")
+            print(f"[{timestamp}] " + instance['_err_prefix'] + f" Failed to download {output_file}")
     
     # If we have downloaded files, parse them
     if downloaded_files:
@@ -320,60 +479,26 @@ def run_single_benchmark(instance, benchmark, benchmark_output_dir, temp_dir):
             "raw_data": {}
         }
         
-        # Parse metadata files first
-        for file_path in metadata_files:
+        # Parse metadata files first, then result files
+        for file_path in metadata_files + result_files:
             try:
-                run_data = parse_benchmark_output.parse_file(
-                    str(file_path), 
-                    benchmark_dir
+                run_data = parse_benchmark_output.parse_bytes(
+                    contents[file_path],
+                    benchmark_dir,
+                    str(file_path)
                 )
-                if run_data and "metrics" in run_data:
-                    # Merge metrics
-                    for key, value in run_data["metrics"].items():
-                        if key not in parsed_data["metrics"]:
-                            parsed_data["metrics"][key] = value
-                        elif key == "runs" and isinstance(value, dict):
-                            if "runs" not in parsed_data["metrics"]:
-                                parsed_data["metrics"]["runs"] = {}
-                            parsed_data["metrics"]["runs"].update(value)
-                    
-                    # Merge system info
-                    if "system_info" in run_data:
-                        parsed_data["system_info"].update(run_data["system_info"])
+                _merge_parsed(parsed_data, run_data)
             except Exception as e:
                 timestamp = get_timestamp()
-                print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Failed to parse {file_path}: {e}")
-        
-        # Parse result files
-        for file_path in result_files:
-            try:
-                run_data = parse_benchmark_output.parse_file(
-                    str(file_path), 
-                    benchmark_dir
-                )
-                if run_data and "metrics" in run_data:
-                    # Merge metrics
-                    for key, value in run_data["metrics"].items():
-                        if key not in parsed_data["metrics"]:
-                            parsed_data["metrics"][key] = value
-                        elif key == "runs" and isinstance(value, dict):
-                            if "runs" not in parsed_data["metrics"]:
-                                parsed_data["metrics"]["runs"] = {}
-                            parsed_data["metrics"]["runs"].update(value)
-                    
-                    # Merge system info
-                    if "system_info" in run_data:
-                        parsed_data["system_info"].update(run_data["system_info"])
-            except Exception as e:
-                timestamp = get_timestamp()
-                print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Failed to parse {file_path}: {e}")
+                print(f"[{timestamp}] " + instance['_err_prefix'] + f" Failed to parse {file_path}: {e}")
         
         # Parse mpstat files for time-series data
         for file_path in mpstat_files:
             try:
-                run_data = parse_benchmark_output.parse_file(
-                    str(file_path), 
-                    benchmark_dir
+                run_data = parse_benchmark_output.parse_bytes(
+                    contents[file_path],
+                    benchmark_dir,
+                    str(file_path)
                 )
                 if run_data and "metrics" in run_data and "time_series" in run_data["metrics"]:
                     # Extract run name from filename
@@ -383,12 +508,12 @@ def run_single_benchmark(instance, benchmark, benchmark_output_dir, temp_dir):
                         parsed_data["metrics"][f"time_series_{run_name}"] = run_data["metrics"]["time_series"]
             except Exception as e:
                 timestamp = get_timestamp()
-                print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Failed to parse mpstat file {file_path}: {e}")
+                print(f"[{timestamp}] " + instance['_err_prefix'] + f" Failed to parse mpstat file {file_path}: {e}")
     
     # If no files were downloaded or parsing failed, use the raw output
     if not parsed_data:
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Using raw output for benchmark results")
+        print(f"[{timestamp}] " + instance['_prefix'] + " Using raw output for benchmark results")
         try:
             parsed_data = parse_benchmark_output.parse_file(
                 str(raw_output_path),
@@ -396,7 +521,7 @@ def run_single_benchmark(instance, benchmark, benchmark_output_dir, temp_dir):
             )
         except Exception as e:
             timestamp = get_timestamp()
-            print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Failed to parse raw output: {e}")
+            print(f"[{timestamp}] " + instance['_err_prefix'] + f" Failed to parse raw output: {e}")
     
     # Add system information to the parsed data
     if parsed_data:
@@ -407,58 +532,72 @@ def run_single_benchmark(instance, benchmark, benchmark_output_dir, temp_dir):
         if 'instance_type' in instance:
             parsed_data["system_info"]["instance_type"] = instance['instance_type']
     
-    return parsed_data
+    # A CPU result that fell back to the placeholder utilization parsed nothing
+    complete = (
+        exit_code == 0
+        and bool(downloaded_files) and len(downloaded_files) == len(output_files)
+        and bool(parsed_data)
+        and bool(parsed_data["metrics"].get("runs")
+                 or parsed_data["metrics"].get("average_utilization") != parse_benchmark_output.DEFAULT_AVERAGE_UTILIZATION)
+    )
+    return parsed_data, complete
 
 
 def run_benchmark(instance, benchmark, instance_dir, temp_dir):
-    """Run a single benchmark on an instance."""
+    """Run a single benchmark on an instance; returns (result, complete)."""
     benchmark_dir = benchmark["path"]
-    color_idx = hash(instance['name']) % len(INSTANCE_COLORS)
-    color = INSTANCE_COLORS[color_idx]
     
     try:
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + f" Running {benchmark_dir}...")
+        print(f"[{timestamp}] " + instance['_prefix'] + f" Running {benchmark_dir}...")
         
         # Run setup script
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + f" Running setup script for {benchmark_dir}...")
+        print(f"[{timestamp}] " + instance['_prefix'] + f" Running setup script for {benchmark_dir}...")
         exit_code = run_ssh_command(
             instance,
             f"cd ~/benchmarks/{temp_dir}/bench_guide/{benchmark_dir} && chmod +x setup.sh && ./setup.sh"
         )
-        if exit_code != 0:
+        setup_ok = exit_code == 0
+        if not setup_ok:
             timestamp = get_timestamp()
-            print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Setup script failed with exit code {exit_code}")
+            print(f"[{timestamp}] " + instance['_err_prefix'] + f" Setup script failed with exit code {exit_code}")
         
         # Create benchmark directory
         benchmark_output_dir = instance_dir / benchmark_dir
         benchmark_output_dir.mkdir(exist_ok=True)
         
-        return run_single_benchmark(instance, benchmark, benchmark_output_dir, temp_dir)
+        parsed_data, complete = run_single_benchmark(instance, benchmark, benchmark_output_dir, temp_dir)
+        return parsed_data, setup_ok and complete
     
     except Exception as e:
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Error running {benchmark_dir}: {str(e)}")
-        return None
+        print(f"[{timestamp}] " + instance['_err_prefix'] + f" Error running {benchmark_dir}: {str(e)}")
+        return None, False
 
 
 def collect_system_info(instance):
     """Collect system information from an instance."""
     system_info = {}
-    color_idx = hash(instance['name']) % len(INSTANCE_COLORS)
-    color = INSTANCE_COLORS[color_idx]
     
-    # Get architecture
+    # Probe architecture, CPU model and core count in one round trip; the
+    # fields are separated by \037 since cpuinfo lines contain tabs
     timestamp = get_timestamp()
-    print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Getting architecture...")
+    print(f"[{timestamp}] " + instance['_prefix'] + " Getting architecture, CPU model and cores...")
     exit_code, stdout, stderr = run_ssh_command(
         instance,
-        "uname -m",
+        "printf '%s\\037%s\\037%s' \"$(uname -m)\" "
+        "\"$(grep -m1 'model name' /proc/cpuinfo || lscpu | grep -m1 'Model name')\" \"$(nproc)\"",
         capture_output=True
     )
-    if exit_code == 0 and stdout.strip():
-        arch = stdout.strip()
+    if exit_code != 0:
+        return system_info
+    
+    fields = stdout.split('\037')
+    arch, cpu_line, cores = (fields + ['', '', ''])[:3]
+    
+    arch = arch.strip()
+    if arch:
         if "aarch64" in arch or "arm64" in arch:
             system_info["architecture"] = "ARM64"
         elif "x86_64" in arch:
@@ -466,49 +605,57 @@ def collect_system_info(instance):
         else:
             system_info["architecture"] = arch
     
-    # Get CPU model
-    timestamp = get_timestamp()
-    print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Getting CPU model...")
-    exit_code, stdout, stderr = run_ssh_command(
-        instance,
-        "cat /proc/cpuinfo | grep 'model name' | head -1 || lscpu | grep 'Model name'",
-        capture_output=True
-    )
-    if exit_code == 0 and stdout.strip():
-        for line in stdout.splitlines():
-            if ':' in line:
-                cpu_model = line.split(':', 1)[1].strip()
-                system_info["cpu_model"] = cpu_model
-                break
-    
-    # Get CPU cores
-    timestamp = get_timestamp()
-    print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Getting CPU cores...")
-    exit_code, stdout, stderr = run_ssh_command(
-        instance,
-        "nproc",
-        capture_output=True
-    )
-    if exit_code == 0 and stdout.strip():
+    if ':' in cpu_line:
+        system_info["cpu_model"] = cpu_line.split(':', 1)[1].strip()
+    
+    cores = cores.strip()
+    if cores:
         try:
-            system_info["cpu_cores"] = int(stdout.strip())
+            system_info["cpu_cores"] = int(cores)
         except ValueError:
             pass
     
     return system_info
 
 
+def result_cache_path(benchmark, instance, repo_sha):
+    """Get the cache file for a benchmark's result on an instance type at a commit."""
+    key = hashlib.sha1(f"{benchmark['path']}|{instance.get('instance_type', '')}|{repo_sha}".encode()).hexdigest()
+    return RESULT_CACHE_DIR / f"{key}.json"
+
+
+def load_cached_result(cache_path):
+    """Load a cached benchmark result, or None if there is no usable one."""
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def store_cached_result(cache_path, parsed_data):
+    """Write a benchmark result to the cache atomically."""
+    try:
+        RESULT_CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w') as f:
+            # Time series columns are arrays; store them as plain lists
+            json.dump(parsed_data, f, default=list)
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        timestamp = get_timestamp()
+        print(f"[{timestamp}] Warning: Could not cache result in {cache_path}: {e}")
+
+
 def run_benchmarks_on_instance(instance, benchmarks, run_dir):
     """Run benchmarks on a single instance."""
     instance_results = {}
     instance_dir = run_dir / instance["name"]
     instance_dir.mkdir(exist_ok=True)
-    color_idx = hash(instance['name']) % len(INSTANCE_COLORS)
-    color = INSTANCE_COLORS[color_idx]
     
     try:
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + f" Connecting to {instance['ip']}...")
+        print(f"[{timestamp}] " + instance['_prefix'] + f" Connecting to {instance['ip']}...")
         
         # Test SSH connection
         exit_code = run_ssh_command(instance, "echo 'SSH connection successful'")
@@ -517,75 +664,92 @@ def run_benchmarks_on_instance(instance, benchmarks, run_dir):
             
         # Collect system information
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Collecting system information...")
+        print(f"[{timestamp}] " + instance['_prefix'] + " Collecting system information...")
         instance['system_info'] = collect_system_info(instance)
         
-        # Install required packages (check if already done)
+        # Install required packages unless dpkg already has them; the check
+        # and the install share one round trip
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Checking for required packages...")
-        exit_code, stdout, stderr = run_ssh_command(
+        print(f"[{timestamp}] " + instance['_prefix'] + " Checking for required packages...")
+        exit_code = run_ssh_command(
             instance,
-            "test -f \"$HOME/.visualizer_packages_installed\" && echo 'already_installed' || echo 'need_install'",
-            capture_output=True
+            f"if dpkg -s {REQUIRED_PACKAGES} >/dev/null 2>&1; then "
+            "echo 'Packages already installed, skipping apt commands'; "
+            "else echo 'Installing required packages...' && sudo apt-get update -y && "
+            f"sudo apt-get install -y --no-install-recommends {REQUIRED_PACKAGES}; fi"
         )
-        
-        if "already_installed" in stdout:
-            timestamp = get_timestamp()
-            print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Packages already installed, skipping apt commands")
-        else:
+        if exit_code != 0:
             timestamp = get_timestamp()
-            print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Installing required packages...")
-            exit_code = run_ssh_command(
-                instance,
-                "sudo apt-get update -y && sudo apt-get install git build-essential -y && touch \"$HOME/.visualizer_packages_installed\""
-            )
-            if exit_code != 0:
-                timestamp = get_timestamp()
-                print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Package installation failed with exit code {exit_code}")
+            print(f"[{timestamp}] " + instance['_err_prefix'] + f" Package installation failed with exit code {exit_code}")
         
-        # Create a unique temporary directory
+        # Refresh the cached checkout (shallow clone on first use), then
+        # copy it into a unique directory for this run; the lock keeps
+        # concurrent runs from rewriting the cache mid-copy
         timestamp_str = datetime.now().strftime("%Y%m%d_%H%M%S")
         unique_id = f"bench_{timestamp_str}_{os.getpid()}"
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + f" Creating temporary directory {unique_id}...")
-        exit_code, stdout, stderr = run_ssh_command(
-            instance,
-            f"mkdir -p ~/benchmarks/{unique_id}",
-            capture_output=True
-        )
-        if exit_code != 0:
-            raise Exception(f"Failed to create temporary directory: {stderr.strip()}")
-        
-        # Clone repo into the temporary directory
-        timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Cloning repository...")
+        print(f"[{timestamp}] " + instance['_prefix'] + f" Updating repository cache and creating {unique_id}...")
         exit_code = run_ssh_command(
             instance,
-            f"cd ~/benchmarks/{unique_id} && git clone {REPO_URL}"
+            f"mkdir -p ~/benchmarks/{unique_id} && ( flock 9 && "
+            f"if [ -d {REPO_CACHE_DIR}/.git ]; then "
+            f"git -C {REPO_CACHE_DIR} fetch --depth 1 origin && git -C {REPO_CACHE_DIR} reset --hard FETCH_HEAD && git -C {REPO_CACHE_DIR} clean -fdx; "
+            f"else rm -rf {REPO_CACHE_DIR} && git clone --depth 1 --single-branch --no-tags {REPO_URL} {REPO_CACHE_DIR}; fi && "
+            f"cp -a {REPO_CACHE_DIR} ~/benchmarks/{unique_id}/bench_guide ) 9>{REPO_CACHE_LOCK}"
         )
         if exit_code != 0:
-            raise Exception(f"Failed to clone repository with exit code {exit_code}")
+            raise Exception(f"Failed to prepare repository with exit code {exit_code}")
+        
+        # Reuse stored results for benchmarks already run on this instance
+        # type at the current commit
+        queued = list(benchmarks)
+        cache_paths = {}
+        if USE_RESULT_CACHE:
+            exit_code, stdout, stderr = run_ssh_command(
+                instance,
+                f"git -C ~/benchmarks/{unique_id}/bench_guide rev-parse HEAD",
+                capture_output=True
+            )
+            repo_sha = stdout.strip() if exit_code == 0 else ""
+            if repo_sha:
+                for benchmark in benchmarks:
+                    cache_path = result_cache_path(benchmark, instance, repo_sha)
+                    cached = load_cached_result(cache_path)
+                    if cached is None:
+                        cache_paths[benchmark["path"]] = cache_path
+                    else:
+                        timestamp = get_timestamp()
+                        print(f"[{timestamp}] " + instance['_prefix'] + f" Using cached result for {benchmark['path']} at {repo_sha[:12]}")
+                        instance_results[benchmark["path"]] = cached
+                        queued.remove(benchmark)
         
-        # Run benchmarks in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(benchmarks)) as executor:
-            future_to_benchmark = {
-                executor.submit(run_benchmark, instance, benchmark, instance_dir, unique_id): benchmark
-                for benchmark in benchmarks
-            }
+        # Run benchmarks in parallel on the shared pool, keeping at most
+        # MAX_BENCHMARKS_PER_INSTANCE in flight on this instance
+        future_to_benchmark = {}
+        while queued or future_to_benchmark:
+            while queued and len(future_to_benchmark) < MAX_BENCHMARKS_PER_INSTANCE:
+                benchmark = queued.pop(0)
+                future = BENCHMARK_EXECUTOR.submit(run_benchmark, instance, benchmark, instance_dir, unique_id)
+                future_to_benchmark[future] = benchmark
             
-            for future in concurrent.futures.as_completed(future_to_benchmark):
-                benchmark = future_to_benchmark[future]
+            done, _ = concurrent.futures.wait(future_to_benchmark, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                benchmark = future_to_benchmark.pop(future)
                 try:
-                    benchmark_result = future.result()
+                    benchmark_result, complete = future.result()
                     if benchmark_result:
                         instance_results[benchmark["path"]] = benchmark_result
+                        # Only successful runs are cached; a failed one would
+                        # otherwise be replayed on every later run
+                        if complete and benchmark["path"] in cache_paths:
+                            store_cached_result(cache_paths[benchmark["path"]], benchmark_result)
                 except Exception as e:
                     timestamp = get_timestamp()
-                    print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" Error running benchmark {benchmark['path']}: {e}")
+                    print(f"[{timestamp}] " + instance['_err_prefix'] + f" Error running benchmark {benchmark['path']}: {e}")
         
         # Clean up temporary directory
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " Cleaning up temporary directory...")
+        print(f"[{timestamp}] " + instance['_prefix'] + " Cleaning up temporary directory...")
         run_ssh_command(
             instance,
             f"rm -rf ~/benchmarks/{unique_id}"
@@ -595,7 +759,7 @@ def run_benchmarks_on_instance(instance, benchmarks, run_dir):
         
     except Exception as e:
         timestamp = get_timestamp()
-        print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" {str(e)}")
+        print(f"[{timestamp}] " + instance['_err_prefix'] + f" {str(e)}")
         raise
 
 
@@ -608,6 +772,10 @@ def run_benchmarks_on_instances(provider, instances, selected_benchmarks):
     run_dir = RESULTS_DIR / timestamp_str
     run_dir.mkdir(exist_ok=True)
     
+    # Resolve each instance's log color and prefixes once up front
+    for instance in instances:
+        set_instance_style(instance)
+    
     timestamp = get_timestamp()
     print(f"\n[{timestamp}] Running benchmarks on {len(instances)} instances...")
     
@@ -626,15 +794,11 @@ def run_benchmarks_on_instances(provider, instances, selected_benchmarks):
             try:
                 instance_results = future.result()
                 results[instance["name"]] = instance_results
-                color_idx = hash(instance['name']) % len(INSTANCE_COLORS)
-                color = INSTANCE_COLORS[color_idx]
                 timestamp = get_timestamp()
-                print(f"[{timestamp}] " + colored(f"[{instance['name']}]", color) + " ✓ Completed benchmarks")
+                print(f"[{timestamp}] " + instance['_prefix'] + " ✓ Completed benchmarks")
             except Exception as e:
-                color_idx = hash(instance['name']) % len(INSTANCE_COLORS)
-                color = INSTANCE_COLORS[color_idx]
                 timestamp = get_timestamp()
-                print(f"[{timestamp}] " + colored(f"[{instance['name']}-ERR]", color) + f" ✗ Error running benchmarks: {e}")
+                print(f"[{timestamp}] " + instance['_err_prefix'] + f" ✗ Error running benchmarks: {e}")
     
     return results, run_dir
 
@@ -649,7 +813,7 @@ def lazy_reload_last_results():
         print(f"[{timestamp}] No results directory found")
         return None
     
-    result_dirs = [d for d in RESULTS_DIR.iterdir() if d.is_dir()]
+    result_dirs = [d for d in RESULTS_DIR.iterdir() if d.is_dir() and not d.name.startswith(".")]
     if not result_dirs:
         print(f"[{timestamp}] No result directories found")
         return None
@@ -696,20 +860,11 @@ def lazy_reload_last_results():
                         elif "raw_output" in filename:
                             raw_output_file = file_path
                     
-                    # Parse metadata files first
-                    for file_path in metadata_files:
+                    # Parse metadata files first, then result files
+                    for file_path in metadata_files + result_files:
                         try:
                             run_data = parse_benchmark_output.parse_file(str(file_path), benchmark_type)
-                            if run_data and "metrics" in run_data:
-                                for key, value in run_data["metrics"].items():
-                                    if key not in parsed_data["metrics"]:
-                                        parsed_data["metrics"][key] = value
-                                    elif key == "runs" and isinstance(value, dict):
-                                        if "runs" not in parsed_data["metrics"]:
-                                            parsed_data["metrics"]["runs"] = {}
-                                        parsed_data["metrics"]["runs"].update(value)
-                                if "system_info" in run_data:
-                                    parsed_data["system_info"].update(run_data["system_info"])
+                            _merge_parsed(parsed_data, run_data)
                         except Exception as e:
                             pass
                     
@@ -725,23 +880,6 @@ def lazy_reload_last_results():
                         except Exception as e:
                             pass
                     
-                    # Parse result files
-                    for file_path in result_files:
-                        try:
-                            run_data = parse_benchmark_output.parse_file(str(file_path), benchmark_type)
-                            if run_data and "metrics" in run_data:
-                                for key, value in run_data["metrics"].items():
-                                    if key not in parsed_data["metrics"]:
-                                        parsed_data["metrics"][key] = value
-                                    elif key == "runs" and isinstance(value, dict):
-                                        if "runs" not in parsed_data["metrics"]:
-                                            parsed_data["metrics"]["runs"] = {}
-                                        parsed_data["metrics"]["runs"].update(value)
-                                if "system_info" in run_data:
-                                    parsed_data["system_info"].update(run_data["system_info"])
-                        except Exception as e:
-                            pass
-                    
                     # Fallback to raw output if no data
                     if not parsed_data["metrics"] and raw_output_file:
                         try:
@@ -756,6 +894,11 @@ def lazy_reload_last_results():
 
 def main():
     """Main function."""
+    global USE_RESULT_CACHE
+    args = parse_args()
+    if args.cache:
+        USE_RESULT_CACHE = True
+    
     timestamp = get_timestamp()
     print(f"[{timestamp}] Benchmark Visualization Tool")
     print(f"[{timestamp}] ===========================\n")
@@ -772,7 +915,7 @@ def main():
             report_path = generate_html_report.create_report(results, run_dir)
             
             timestamp = get_timestamp()
-            print(f"\n[{timestamp}] Report regenerated! Available at: {report_path}")
+            print(f"\n[{timestamp}] Report ready! Available at: {report_path}")
             
             # Auto-open the report in the default browser
             try:
@@ -791,7 +934,7 @@ def main():
     
     # Select cloud provider
     # provider_name = select_cloud_provider()  # TODO: Add back when supporting multiple providers
-    provider_name = "aws"  # Default to AWS for now
+    provider_name = args.provider or "aws"  # Default to AWS for now
     
     # Get provider module
     if provider_name == "aws":
@@ -821,18 +964,13 @@ def main():
         print(f"[{timestamp}] {i}. {instance['name']} ({instance['ip']})")
     
     # Select instances
-    timestamp = get_timestamp()
-    print(f"\n[{timestamp}] Enter instance numbers to use (comma-separated, or 'all') [1,2]:")
-    selection = input(f"[{get_timestamp()}] > ").strip()
-    
-    if selection.lower() == "all":
-        selected_instances = instances
-    elif not selection:  # Default to first two instances if no input
-        default_indices = [0, 1]  # 0-based indices for instances 1 and 2
-        selected_instances = [instances[idx] for idx in default_indices if 0 <= idx < len(instances)]
+    if args.instances is not None:
+        selection = args.instances
     else:
-        selected_indices = [int(idx.strip()) - 1 for idx in selection.split(",") if idx.strip().isdigit()]
-        selected_instances = [instances[idx] for idx in selected_indices if 0 <= idx < len(instances)]
+        timestamp = get_timestamp()
+        print(f"\n[{timestamp}] Enter instance numbers to use (comma-separated, or 'all') [1,2]:")
+        selection = input(f"[{get_timestamp()}] > ")
+    selected_instances = select_instances(instances, selection)
     
     if not selected_instances:
         timestamp = get_timestamp()
@@ -840,7 +978,7 @@ def main():
         sys.exit(1)
     
     # Select benchmarks
-    selected_benchmarks = select_benchmarks()
+    selected_benchmarks = select_benchmarks(args.benchmarks)
     
     if not selected_benchmarks:
         timestamp = get_timestamp()
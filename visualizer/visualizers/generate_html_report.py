@@ -7,8 +7,188 @@ Generates HTML reports from benchmark results.
 
 import os
 import json
+import hashlib
 from pathlib import Path
+from collections import defaultdict
 from datetime import datetime
+from html import escape
+from string import Template
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+# Static page scaffolding, read once at import; the footer holds the one
+# script that builds every chart from the chart-data JSON block
+_TEMPLATE_DIR = Path(__file__).parent / "templates"
+_HTML_HEAD = Template((_TEMPLATE_DIR / "header.html").read_text())
+_HTML_FOOT = (_TEMPLATE_DIR / "footer.html").read_text()
+
+# Digest of this generator and the templates it loads; a saved report is
+# only reused if it was rendered by the same code from the same results
+_GENERATOR_DIGEST = hashlib.blake2b(
+    Path(__file__).read_bytes()
+    + (_TEMPLATE_DIR / "header.html").read_bytes()
+    + (_TEMPLATE_DIR / "footer.html").read_bytes()
+).digest()
+
+# Comparison chart colors, one (r, g, b) per run:
+# red, blue, green, orange, purple, cyan
+_PALETTE = [(220, 53, 69), (54, 162, 235), (40, 167, 69), (255, 153, 0), (128, 0, 128), (0, 188, 212)]
+
+# Per-run CPU breakdown: stacked mpstat columns, their labels and colors
+_STACKED_METRICS = ('usr', 'sys', 'iowait')
+_STACKED_LABELS = {'usr': 'User', 'sys': 'System', 'iowait': 'I/O Wait'}
+_STACKED_COLORS = {
+    'usr': (255, 99, 132),   # Red
+    'sys': (54, 162, 235),   # Blue
+    'iowait': (255, 206, 86) # Yellow
+}
+
+# Per-instance line colors for the overall time-series chart
+_COLORS = ((255, 99, 132), (54, 162, 235), (255, 205, 86), (75, 192, 192))
+
+# Compact JSON for the inline chart configs; one shared encoder, since
+# json.dumps builds a new one whenever it is given options
+_dumps = json.JSONEncoder(separators=(',', ':')).encode
+
+# Chart.js options shared by every chart of a kind, serialized once
+_BAR_OPTS_JSON = _dumps({
+    "responsive": True,
+    "maintainAspectRatio": False,
+    "scales": {"y": {"beginAtZero": True, "max": 100}}
+})
+_LABELED_BAR_OPTS_JSON = _dumps({
+    "responsive": True,
+    "maintainAspectRatio": False,
+    "plugins": {
+        "datalabels": {"anchor": "end", "align": "top", "font": {"weight": "bold"}}
+    },
+    "scales": {"y": {"beginAtZero": True, "max": 100}}
+})
+_GENERIC_BAR_OPTS_JSON = _dumps({
+    "responsive": True,
+    "maintainAspectRatio": False,
+    "plugins": {
+        "datalabels": {"anchor": "end", "align": "top", "font": {"weight": "bold"}}
+    },
+    "scales": {"y": {"beginAtZero": True}}
+})
+_STACKED_OPTS_JSON = _dumps({
+    "responsive": True,
+    "maintainAspectRatio": False,
+    "scales": {
+        "x": {"type": "category", "stacked": True, "title": {"display": True, "text": "Time"}},
+        "y": {
+            "stacked": True,
+            "beginAtZero": True,
+            "max": 100,
+            "title": {"display": True, "text": "CPU Utilization (%)"}
+        }
+    },
+    "plugins": {
+        "legend": {"display": True, "position": "top"},
+        "tooltip": {"mode": "index", "intersect": False}
+    }
+})
+_LINE_OPTS_JSON = _dumps({
+    "responsive": True,
+    "maintainAspectRatio": False,
+    "scales": {
+        "x": {"type": "category", "title": {"display": True, "text": "Time"}},
+        "y": {
+            "beginAtZero": True,
+            "max": 100,
+            "title": {"display": True, "text": "CPU Utilization (%)"}
+        }
+    },
+    "plugins": {
+        "legend": {"display": True, "position": "top"},
+        "tooltip": {"mode": "index", "intersect": False}
+    }
+})
+_TIME_SERIES_OPTS_JSON = _dumps({
+    "responsive": True,
+    "maintainAspectRatio": False,
+    "scales": {
+        "x": {"type": "category", "title": {"display": True, "text": "Time"}},
+        "y": {
+            "beginAtZero": True,
+            "max": 100,
+            "title": {"display": True, "text": "CPU Utilization (%)"}
+        }
+    },
+    "plugins": {"legend": {"display": True}}
+})
+
+
+# System info table columns after the instance name, and the row formatter
+_SYSTEM_INFO_FIELDS = ("instance_type", "architecture", "cpu_model", "cpu_cores")
+_SYSTEM_INFO_ROW = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>\n".format
+
+# Shared read-only default for missing sub-dicts, instead of a fresh {} per miss
+_EMPTY = MappingProxyType({})
+
+
+class BenchmarkView(NamedTuple):
+    """One benchmark type's results as parallel per-instance lists."""
+    instances: list  # instance names, in report order
+    system_info: list  # system_info dict per instance
+    metrics: list  # metrics dict per instance
+    runs: list  # metrics["runs"] dict per instance
+    time_series: list  # metrics["time_series"] per instance ([] if missing)
+    run_names: tuple  # sorted names of all runs seen on any instance
+    run_titles: dict  # run name -> display title
+    run_avgs: dict  # run name -> avg_utilization per instance (0 if missing)
+
+
+def _normalize(benchmark_results):
+    """Walk one benchmark type's results once and build its BenchmarkView."""
+    instances = list(benchmark_results)
+    system_info = []
+    metrics = []
+    runs = []
+    time_series = []
+    for data in benchmark_results.values():
+        system_info.append(data.get("system_info", _EMPTY))
+        instance_metrics = data.get("metrics", _EMPTY)
+        metrics.append(instance_metrics)
+        runs.append(instance_metrics.get("runs", _EMPTY))
+        time_series.append(instance_metrics.get("time_series", []))
+    
+    run_names = tuple(sorted({run_name for instance_runs in runs for run_name in instance_runs}))
+    run_titles = {run_name: run_name.replace("_", " ").title() for run_name in run_names}
+    run_avgs = {
+        run_name: [instance_runs.get(run_name, _EMPTY).get("avg_utilization", 0) for instance_runs in runs]
+        for run_name in run_names
+    }
+    return BenchmarkView(instances, system_info, metrics, runs, time_series, run_names, run_titles, run_avgs)
+
+
+def _rgba(color, alpha):
+    """Format an (r, g, b) triple as a CSS rgba() color with the given alpha."""
+    r, g, b = color
+    return f"rgba({r}, {g}, {b}, {alpha})"
+
+
+def _points(time_series, key, fill=None):
+    """Pair each sample time with its `key` value as a Chart.js point.
+    
+    A missing `key` series yields no points, or `fill` at every time if given.
+    """
+    times = time_series.get('time', [])
+    values = time_series.get(key)
+    if values is None:
+        values = [] if fill is None else [fill] * len(times)
+    return [{'x': t, 'y': y} for t, y in zip(times, values)]
+
+
+def _chart_spec(canvas, chart_type, data, options_json, unit=''):
+    """Serialize one chart-data entry around a pre-serialized option blob.
+    
+    `unit` is appended to the value labels of charts that enable datalabels.
+    """
+    config = f'{{"type":"{chart_type}","data":{_dumps(data)},"options":{options_json}}}'
+    return f'{{"id":{_dumps(canvas)},"unit":{_dumps(unit)},"config":{config}}}'
 
 
 def create_report(results, run_dir):
@@ -20,417 +200,261 @@ def create_report(results, run_dir):
         run_dir (Path): Directory containing result files
         
     Returns:
-        str: Path to the generated report
+        Path: Path to the generated report
     """
     report_path = run_dir / "report.html"
+    key_path = run_dir / ".report_key"
+    
+    # Re-rendering unchanged results (e.g. a lazy reload) reuses the report,
+    # including its original "Generated on" time
+    key = _results_key(results)
+    if key and report_path.exists():
+        try:
+            if key_path.read_text() == key:
+                return report_path
+        except OSError:
+            pass
+    
+    # Drop the old key first so an interrupted write is never reused
+    key_path.unlink(missing_ok=True)
     
-    # Create HTML content
-    html = generate_html(results)
+    # Stream HTML straight into a large write buffer as it is generated
+    with open(report_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write_html(results, f.write)
     
-    # Write HTML to file
-    with open(report_path, 'w') as f:
-        f.write(html)
+    if key:
+        key_path.write_text(key)
     
-    return str(report_path)
+    return report_path
+
+
+def _results_key(results):
+    """Content hash of the results and generator, or None if not serializable."""
+    try:
+        # Time series columns may be arrays; hash them as plain lists
+        data = json.dumps(results, sort_keys=True, default=list).encode()
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(data, key=_GENERATOR_DIGEST).hexdigest()
 
 
 def generate_html(results):
     """Generate HTML content for the report."""
+    # Fragments are collected and joined once at the end
+    out = []
+    write_html(results, out.append)
+    return "".join(out)
+
+
+def write_html(results, write):
+    """Generate the report, passing each HTML fragment in order to write()."""
+    # Chart configs are collected here and emitted together at the end
+    charts = []
+    
     # Start with HTML header
-    html = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Benchmark Results</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chartjs-plugin-datalabels@2"></script>
-    <style>
-        body {
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 20px;
-            border-radius: 5px;
-            box-shadow: 0 0 10px rgba(0,0,0,0.1);
-        }
-        h1, h2, h3 {
-            color: #333;
-        }
-        .benchmark {
-            margin-bottom: 30px;
-            padding: 15px;
-            border: 1px solid #ddd;
-            border-radius: 5px;
-        }
-        .chart-container {
-            height: 400px;
-            margin: 20px 0;
-        }
-        table {
-            width: 100%;
-            border-collapse: collapse;
-            margin: 15px 0;
-        }
-        th, td {
-            padding: 8px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }
-        th {
-            background-color: #f2f2f2;
-        }
-        .system-info, .stress-metrics {
-            background-color: #f9f9f9;
-            padding: 10px;
-            border-radius: 5px;
-            margin-bottom: 15px;
-        }
-        .stress-metrics {
-            background-color: #f0f8ff;
-            font-size: 0.9em;
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Benchmark Results</h1>
-        <p>Generated on: """ + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + """</p>
-"""
+    write(_HTML_HEAD.substitute(generated_on=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
     
     # Group results by benchmark type
-    benchmarks = {}
+    benchmarks = defaultdict(dict)
     for instance_name, instance_results in results.items():
         for benchmark_type, benchmark_data in instance_results.items():
-            if benchmark_type not in benchmarks:
-                benchmarks[benchmark_type] = {}
             benchmarks[benchmark_type][instance_name] = benchmark_data
     
     # Generate content for each benchmark type
     for benchmark_type, benchmark_results in benchmarks.items():
-        html += f'<div class="benchmark">\n'
-        html += f'<h2>Benchmark: {benchmark_type}</h2>\n'
+        write(f'<div class="benchmark">\n')
+        write(f'<h2>Benchmark: {escape(benchmark_type)}</h2>\n')
         
         # System information section
-        html += '<div class="system-info">\n'
-        html += '<h3>System Information</h3>\n'
-        html += '<table>\n'
-        html += '<tr><th>Name</th><th>Type</th><th>Architecture</th><th>CPU Model</th><th>CPU Cores</th></tr>\n'
+        write('<div class="system-info">\n')
+        write('<h3>System Information</h3>\n')
+        write('<table>\n')
+        write('<tr><th>Name</th><th>Type</th><th>Architecture</th><th>CPU Model</th><th>CPU Cores</th></tr>\n')
         
-        for instance_name, data in benchmark_results.items():
-            arch = data.get("system_info", {}).get("architecture", "N/A")
-            cpu_model = data.get("system_info", {}).get("cpu_model", "N/A")
-            cpu_cores = data.get("system_info", {}).get("cpu_cores", "N/A")
-            instance_type = data.get("system_info", {}).get("instance_type", "N/A")
-            
-            html += f'<tr><td>{instance_name}</td><td>{instance_type}</td><td>{arch}</td><td>{cpu_model}</td><td>{cpu_cores}</td></tr>\n'
+        view = _normalize(benchmark_results)
+        # System info comes from the instances themselves; escape it
+        write("".join(
+            _SYSTEM_INFO_ROW(escape(instance_name), *(escape(str(system_info.get(field, "N/A"))) for field in _SYSTEM_INFO_FIELDS))
+            for instance_name, system_info in zip(view.instances, view.system_info)
+        ))
         
-        html += '</table>\n'
-        html += '</div>\n'
+        write('</table>\n')
+        write('</div>\n')
         
         # Generate charts based on benchmark type
         if benchmark_type == "100_cpu_utilization":
-            html += generate_cpu_utilization_charts(benchmark_results)
-            html += generate_mpstat_time_series_charts(benchmark_results)
+            generate_cpu_utilization_charts(view, write, charts)
+            generate_mpstat_time_series_charts(view, write, charts)
         else:
-            html += generate_generic_charts(benchmark_results, benchmark_type)
+            generate_generic_charts(view, benchmark_type, write, charts)
         
-        html += '</div>\n'
+        write('</div>\n')
     
-    # Close HTML
-    html += """
-    </div>
-    <script>
-        // Initialize all charts
-        document.addEventListener('DOMContentLoaded', function() {
-            // Charts will be initialized by their specific functions
-        });
-    </script>
-</body>
-</html>
-"""
+    # All chart configs go out as one JSON block; "</" is escaped so no
+    # string inside it can close the script element
+    write('<script id="chart-data" type="application/json">[')
+    write(",".join(charts).replace("</", "<\\/"))
+    write(']</script>\n')
     
-    return html
+    # Close HTML
+    write(_HTML_FOOT)
 
 
-def generate_cpu_utilization_charts(results):
+def generate_cpu_utilization_charts(view, write, charts):
     """Generate charts for CPU utilization benchmark."""
-    html = ""
+    run_names = view.run_names
     
-    # Check if we have run data
-    has_runs = False
-    run_names = set()
-    for instance_name, data in results.items():
-        if "runs" in data.get("metrics", {}):
-            has_runs = True
-            run_names.update(data.get("metrics", {}).get("runs", {}).keys())
-    
-    if has_runs and run_names:
-        # Sort run names for consistent order
-        run_names = sorted(run_names)
-        
+    if run_names:
         # Generate a chart for each run type
         for i, run_name in enumerate(run_names):
-            html += f'<h3>CPU Utilization - {run_name.replace("_", " ").title()}</h3>\n'
-            html += f'<div class="chart-container"><canvas id="avgUtilChart_{i}"></canvas></div>\n'
-            
-            # Prepare data for the chart
-            labels = []
-            datasets = []
+            pretty = view.run_titles[run_name]
+            write(f'<h3>CPU Utilization - {escape(pretty)}</h3>\n')
             
-            for instance_name, data in results.items():
-                labels.append(instance_name)
-                run_data = data.get("metrics", {}).get("runs", {}).get(run_name, {})
-                avg_util = run_data.get("avg_utilization", 0)
-                datasets.append(avg_util)
+            # Prepare data for the chart; a run with no utilization anywhere
+            # only gets its mpstat charts
+            labels = view.instances
+            datasets = view.run_avgs[run_name]
+            has_avgs = any(datasets)
+            if has_avgs:
+                write(f'<div class="chart-container"><canvas id="avgUtilChart_{i}"></canvas></div>\n')
             
             # Add mpstat time-series chart for this specific run
-            html += generate_run_specific_mpstat_chart(results, run_name, i)
+            generate_run_specific_mpstat_chart(view, run_name, i, write, charts)
             
-            # Add chart initialization script
-            html += f"""
-            <script>
-                document.addEventListener('DOMContentLoaded', function() {{
-                    const avgUtilCtx = document.getElementById('avgUtilChart_{i}').getContext('2d');
-                    new Chart(avgUtilCtx, {{
-                        type: 'bar',
-                        data: {{
-                            labels: {json.dumps(labels)},
-                            datasets: [{{
-                                label: '{run_name.replace("_", " ").title()} - CPU Utilization (%)',
-                                data: {json.dumps(datasets)},
-                                backgroundColor: 'rgba(54, 162, 235, 0.5)',
-                                borderColor: 'rgba(54, 162, 235, 1)',
-                                borderWidth: 1
-                            }}]
-                        }},
-                        options: {{
-                            responsive: true,
-                            maintainAspectRatio: false,
-                            plugins: {{
-                                datalabels: {{
-                                    anchor: 'end',
-                                    align: 'top',
-                                    formatter: function(value) {{
-                                        return value.toFixed(1) + '%';
-                                    }},
-                                    font: {{
-                                        weight: 'bold'
-                                    }}
-                                }}
-                            }},
-                            scales: {{
-                                y: {{
-                                    beginAtZero: true,
-                                    max: 100
-                                }}
-                            }}
-                        }},
-                        plugins: [ChartDataLabels]
-                    }});
-                }});
-            </script>
-            """
+            # Queue the chart config
+            if has_avgs:
+                config_data = {
+                    "labels": labels,
+                    "datasets": [{
+                        "label": f'{pretty} - CPU Utilization (%)',
+                        "data": datasets,
+                        "backgroundColor": "rgba(54, 162, 235, 0.5)",
+                        "borderColor": "rgba(54, 162, 235, 1)",
+                        "borderWidth": 1
+                    }]
+                }
+                charts.append(_chart_spec(f'avgUtilChart_{i}', "bar", config_data, _LABELED_BAR_OPTS_JSON, unit='%'))
     else:
         # Fallback to the old chart if no run data is available
-        html += '<h3>Average CPU Utilization</h3>\n'
-        html += '<div class="chart-container"><canvas id="avgUtilChart"></canvas></div>\n'
+        write('<h3>Average CPU Utilization</h3>\n')
+        write('<div class="chart-container"><canvas id="avgUtilChart"></canvas></div>\n')
         
         # Prepare data for the chart
-        labels = []
+        labels = view.instances
         datasets = []
         
-        for instance_name, data in results.items():
-            labels.append(instance_name)
-            avg_util = data.get("metrics", {}).get("average_utilization", [0])
+        for metrics in view.metrics:
+            avg_util = metrics.get("average_utilization", [0])
             if avg_util:
                 datasets.append(avg_util[0])  # Use the first value
         
-        # Add chart initialization script
-        html += f"""
-        <script>
-            document.addEventListener('DOMContentLoaded', function() {{
-                const avgUtilCtx = document.getElementById('avgUtilChart').getContext('2d');
-                new Chart(avgUtilCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: {json.dumps(labels)},
-                        datasets: [{{
-                            label: 'Average CPU Utilization (%)',
-                            data: {json.dumps(datasets)},
-                            backgroundColor: 'rgba(54, 162, 235, 0.5)',
-                            borderColor: 'rgba(54, 162, 235, 1)',
-                            borderWidth: 1
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        scales: {{
-                            y: {{
-                                beginAtZero: true,
-                                max: 100
-                            }}
-                        }}
-                    }}
-                }});
-            }});
-        </script>
-        """
+        # Queue the chart config
+        config_data = {
+            "labels": labels,
+            "datasets": [{
+                "label": "Average CPU Utilization (%)",
+                "data": datasets,
+                "backgroundColor": "rgba(54, 162, 235, 0.5)",
+                "borderColor": "rgba(54, 162, 235, 1)",
+                "borderWidth": 1
+            }]
+        }
+        charts.append(_chart_spec('avgUtilChart', "bar", config_data, _BAR_OPTS_JSON))
     
     # Add comparison chart if we have multiple runs
-    if has_runs and len(run_names) > 1:
-        html += '<h3>CPU Utilization Comparison</h3>\n'
-        html += '<div class="chart-container"><canvas id="comparisonChart"></canvas></div>\n'
+    if len(run_names) > 1:
+        write('<h3>CPU Utilization Comparison</h3>\n')
+        write('<div class="chart-container"><canvas id="comparisonChart"></canvas></div>\n')
         
         # Prepare data for the comparison chart
         datasets = []
         for i, run_name in enumerate(run_names):
-            run_data = []
-            for instance_name in results.keys():
-                data = results[instance_name]
-                avg_util = data.get("metrics", {}).get("runs", {}).get(run_name, {}).get("avg_utilization", 0)
-                run_data.append(avg_util)
+            run_data = view.run_avgs[run_name]
+            pretty = view.run_titles[run_name]
             
-            # Generate a different color for each run
-            color_idx = i % len(['red', 'blue', 'green', 'orange', 'purple', 'cyan'])
-            color = ['red', 'blue', 'green', 'orange', 'purple', 'cyan'][color_idx]
+            # Give each run its own color
+            color = _PALETTE[i % len(_PALETTE)]
             
             datasets.append({
-                "label": run_name.replace("_", " ").title(),
+                "label": pretty,
                 "data": run_data,
-                "backgroundColor": f"rgba({','.join(map(str, [int(int(hash(color) % 255 * 0.7)), int(int(hash(color[::-1]) % 255 * 0.7)), int(int(hash(color + color) % 255 * 0.7)), 0.5]))})",
-                "borderColor": f"rgba({','.join(map(str, [int(int(hash(color) % 255 * 0.7)), int(int(hash(color[::-1]) % 255 * 0.7)), int(int(hash(color + color) % 255 * 0.7)), 1]))})",
+                "backgroundColor": _rgba(color, 0.5),
+                "borderColor": _rgba(color, 1),
                 "borderWidth": 1
             })
         
-        # Add chart initialization script
-        html += f"""
-        <script>
-            document.addEventListener('DOMContentLoaded', function() {{
-                const comparisonCtx = document.getElementById('comparisonChart').getContext('2d');
-                new Chart(comparisonCtx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: {json.dumps(list(results.keys()))},
-                        datasets: {json.dumps(datasets)}
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            datalabels: {{
-                                anchor: 'end',
-                                align: 'top',
-                                formatter: function(value) {{
-                                    return value.toFixed(1) + '%';
-                                }},
-                                font: {{
-                                    weight: 'bold'
-                                }}
-                            }}
-                        }},
-                        scales: {{
-                            y: {{
-                                beginAtZero: true,
-                                max: 100
-                            }}
-                        }}
-                    }},
-                    plugins: [ChartDataLabels]
-                }});
-            }});
-        </script>
-        """
-    
-    return html
+        # Queue the chart config
+        config_data = {
+            "labels": view.instances,
+            "datasets": datasets
+        }
+        charts.append(_chart_spec('comparisonChart', "bar", config_data, _LABELED_BAR_OPTS_JSON, unit='%'))
 
 
-def generate_run_specific_mpstat_chart(results, run_name, chart_index):
+def generate_run_specific_mpstat_chart(view, run_name, chart_index, write, charts):
     """Generate mpstat time-series chart for a specific run."""
-    html = ""
-    
-    
     # Check if we have time-series data for this run
-    mpstat_data = {}
-    for instance_name, data in results.items():
-        run_time_series = data.get("metrics", {}).get(f"time_series_{run_name}", [])
-        if run_time_series:
-            mpstat_data[instance_name] = run_time_series
-        # Try generic time_series if run-specific not found
-        elif not run_time_series:
-            generic_time_series = data.get("metrics", {}).get("time_series", [])
-            if generic_time_series:
-                mpstat_data[instance_name] = generic_time_series
+    mpstat_data = []
+    series_key = f"time_series_{run_name}"
+    pretty = view.run_titles[run_name]
+    for instance_name, metrics, runs, generic_time_series in zip(view.instances, view.metrics, view.runs, view.time_series):
+        # Fall back to the generic time_series if there is no run-specific one
+        time_series = metrics.get(series_key) or generic_time_series
+        if time_series:
+            mpstat_data.append((instance_name, runs, time_series))
     
     if not mpstat_data:
-        return html
+        return
     
-    # Create a separate chart for each instance
-    for i, (instance_name, time_series) in enumerate(mpstat_data.items()):
+    # Create a separate chart for each instance; canvas ids use indexes so
+    # names never end up inside an attribute
+    for n, (instance_name, runs, time_series) in enumerate(mpstat_data):
+        chart_id = f"mpstatChart_{chart_index}_{n}"
+        
         # Check if detailed metrics are available
-        has_detailed = len(time_series) > 0 and 'usr' in time_series[0]
+        has_detailed = len(time_series.get('time', [])) > 0 and 'usr' in time_series
         
         if has_detailed:
             # Get stress-ng metrics if available
-            run_data = data.get("metrics", {}).get("runs", {}).get(run_name, {})
-            stress_metrics = run_data.get("stress_metrics", {})
+            run_data = runs.get(run_name, _EMPTY)
+            stress_metrics = run_data.get("stress_metrics", _EMPTY)
             
             # Create header with metrics
-            html += f'<h4>{instance_name} - CPU Breakdown - {run_name.replace("_", " ").title()}</h4>\n'
+            write(f'<h4>{escape(instance_name)} - CPU Breakdown - {escape(pretty)}</h4>\n')
             
             # Add stress-ng metrics summary if available
             if stress_metrics:
-                html += '<div class="stress-metrics">\n'
-                html += f'<p><strong>Operations:</strong> {stress_metrics.get("bogo_ops", "N/A")} | '
-                html += f'<strong>Ops/s (real):</strong> {stress_metrics.get("bogo_ops_real", "N/A"):.2f} | '
-                html += f'<strong>Ops/s (CPU):</strong> {stress_metrics.get("bogo_ops_time", "N/A"):.2f} | '
-                html += f'<strong>User:</strong> {stress_metrics.get("usr_time", "N/A"):.2f}s | '
-                html += f'<strong>System:</strong> {stress_metrics.get("sys_time", "N/A"):.2f}s</p>\n'
-                html += '</div>\n'
+                write('<div class="stress-metrics">\n')
+                write(f'<p><strong>Operations:</strong> {stress_metrics.get("bogo_ops", "N/A")} | ')
+                write(f'<strong>Ops/s (real):</strong> {stress_metrics.get("bogo_ops_real", "N/A"):.2f} | ')
+                write(f'<strong>Ops/s (CPU):</strong> {stress_metrics.get("bogo_ops_time", "N/A"):.2f} | ')
+                write(f'<strong>User:</strong> {stress_metrics.get("usr_time", "N/A"):.2f}s | ')
+                write(f'<strong>System:</strong> {stress_metrics.get("sys_time", "N/A"):.2f}s</p>\n')
+                write('</div>\n')
             else:
                 # Debug: Check what's in run_data
-                html += '<div class="stress-metrics">\n'
-                html += f'<p><strong>Stress-ng metrics:</strong> Not available</p>\n'
-                html += '</div>\n'
+                write('<div class="stress-metrics">\n')
+                write(f'<p><strong>Stress-ng metrics:</strong> Not available</p>\n')
+                write('</div>\n')
             
-            html += f'<div class="chart-container"><canvas id="mpstatChart_{instance_name}_{run_name}_{chart_index}"></canvas></div>\n'
+            write(f'<div class="chart-container"><canvas id="{chart_id}"></canvas></div>\n')
             
             # Create stacked datasets for usr, sys, iowait
-            stacked_metrics = ['usr', 'sys', 'iowait']
-            stacked_labels = {'usr': 'User', 'sys': 'System', 'iowait': 'I/O Wait'}
-            stacked_colors = {
-                'usr': 'rgba(255, 99, 132, 0.7)',   # Red
-                'sys': 'rgba(54, 162, 235, 0.7)',   # Blue
-                'iowait': 'rgba(255, 206, 86, 0.7)' # Yellow
-            }
-            
             stacked_datasets = []
-            for metric in stacked_metrics:
-                chart_data = []
-                for point in time_series:
-                    if metric in point:
-                        chart_data.append({'x': point['time'], 'y': point[metric]})
+            for metric in _STACKED_METRICS:
+                chart_data = _points(time_series, metric)
                 
                 if chart_data:
                     stacked_datasets.append({
-                        'label': stacked_labels[metric],
+                        'label': _STACKED_LABELS[metric],
                         'data': chart_data,
-                        'backgroundColor': stacked_colors[metric],
-                        'borderColor': stacked_colors[metric].replace('0.7', '1.0'),
+                        'backgroundColor': _rgba(_STACKED_COLORS[metric], 0.7),
+                        'borderColor': _rgba(_STACKED_COLORS[metric], 1),
                         'borderWidth': 1
                     })
             
             # Add total utilization as a line on top
-            total_data = []
-            for point in time_series:
-                if 'utilization' in point:
-                    total_data.append({'x': point['time'], 'y': point['utilization']})
+            total_data = _points(time_series, 'utilization')
             
             if total_data:
                 stacked_datasets.append({
@@ -444,61 +468,15 @@ def generate_run_specific_mpstat_chart(results, run_name, chart_index):
                     'order': 0  # Draw on top
                 })
             
-            # Add chart initialization script
-            html += f"""
-            <script>
-                document.addEventListener('DOMContentLoaded', function() {{
-                    const mpstatCtx = document.getElementById('mpstatChart_{instance_name}_{run_name}_{chart_index}').getContext('2d');
-                    new Chart(mpstatCtx, {{
-                        type: 'bar',  // Default type for stacked bars
-                        data: {{
-                            datasets: {json.dumps(stacked_datasets)}
-                        }},
-                        options: {{
-                            responsive: true,
-                            maintainAspectRatio: false,
-                            scales: {{
-                                x: {{
-                                    type: 'category',
-                                    stacked: true,
-                                    title: {{
-                                        display: true,
-                                        text: 'Time'
-                                    }}
-                                }},
-                                y: {{
-                                    stacked: true,
-                                    beginAtZero: true,
-                                    max: 100,
-                                    title: {{
-                                        display: true,
-                                        text: 'CPU Utilization (%)'
-                                    }}
-                                }}
-                            }},
-                            plugins: {{
-                                legend: {{
-                                    display: true,
-                                    position: 'top'
-                                }},
-                                tooltip: {{
-                                    mode: 'index',
-                                    intersect: false
-                                }}
-                            }}
-                        }}
-                    }});
-                }});
-            </script>
-            """
+            # Queue the chart config
+            config_data = {"datasets": stacked_datasets}
+            charts.append(_chart_spec(chart_id, "bar", config_data, _STACKED_OPTS_JSON))
         else:
             # Simple chart for total utilization only
-            html += f'<h4>{instance_name} - CPU Utilization - {run_name.replace("_", " ").title()}</h4>\n'
-            html += f'<div class="chart-container"><canvas id="mpstatChart_{instance_name}_{run_name}_{chart_index}"></canvas></div>\n'
+            write(f'<h4>{escape(instance_name)} - CPU Utilization - {escape(pretty)}</h4>\n')
+            write(f'<div class="chart-container"><canvas id="{chart_id}"></canvas></div>\n')
             
-            chart_data = []
-            for point in time_series:
-                chart_data.append({'x': point['time'], 'y': point.get('utilization', point.get('y', 0))})
+            chart_data = _points(time_series, 'utilization', fill=0)
             
             datasets = [{
                 'label': 'Total CPU',
@@ -510,210 +488,87 @@ def generate_run_specific_mpstat_chart(results, run_name, chart_index):
                 'borderWidth': 2
             }]
             
-            html += f"""
-            <script>
-                document.addEventListener('DOMContentLoaded', function() {{
-                    const mpstatCtx = document.getElementById('mpstatChart_{instance_name}_{run_name}_{chart_index}').getContext('2d');
-                    new Chart(mpstatCtx, {{
-                        type: 'line',
-                        data: {{
-                            datasets: {json.dumps(datasets)}
-                        }},
-                        options: {{
-                            responsive: true,
-                            maintainAspectRatio: false,
-                            scales: {{
-                                x: {{
-                                    type: 'category',
-                                    title: {{
-                                        display: true,
-                                        text: 'Time'
-                                    }}
-                                }},
-                                y: {{
-                                    beginAtZero: true,
-                                    max: 100,
-                                    title: {{
-                                        display: true,
-                                        text: 'CPU Utilization (%)'
-                                    }}
-                                }}
-                            }},
-                            plugins: {{
-                                legend: {{
-                                    display: true,
-                                    position: 'top'
-                                }},
-                                tooltip: {{
-                                    mode: 'index',
-                                    intersect: false
-                                }}
-                            }}
-                        }}
-                    }});
-                }});
-            </script>
-            """
-    
-    return html
-    
-    return html
+            config_data = {"datasets": datasets}
+            charts.append(_chart_spec(chart_id, "line", config_data, _LINE_OPTS_JSON))
 
 
-def generate_mpstat_time_series_charts(results):
+def generate_mpstat_time_series_charts(view, write, charts):
     """Generate time-series charts from mpstat data."""
-    html = ""
-    
     # Check if we have time-series data
-    has_time_series = False
-    for instance_name, data in results.items():
-        if "time_series" in data.get("metrics", {}):
-            has_time_series = True
-            break
+    has_time_series = any("time_series" in metrics for metrics in view.metrics)
     
     if not has_time_series:
-        return html
+        return
     
-    html += '<h3>CPU Utilization Over Time</h3>\n'
-    html += '<div class="chart-container"><canvas id="timeSeriesChart"></canvas></div>\n'
+    write('<h3>CPU Utilization Over Time</h3>\n')
+    write('<div class="chart-container"><canvas id="timeSeriesChart"></canvas></div>\n')
     
     # Prepare datasets for each instance
     datasets = []
-    colors = ['rgba(255, 99, 132, 1)', 'rgba(54, 162, 235, 1)', 'rgba(255, 205, 86, 1)', 'rgba(75, 192, 192, 1)']
     
-    for i, (instance_name, data) in enumerate(results.items()):
-        time_series = data.get("metrics", {}).get("time_series", [])
+    for i, (instance_name, time_series) in enumerate(zip(view.instances, view.time_series)):
         if time_series:
-            chart_data = []
-            for point in time_series:
-                chart_data.append({
-                    'x': point['time'],
-                    'y': point['utilization']
-                })
+            chart_data = _points(time_series, 'utilization')
             
-            color = colors[i % len(colors)]
+            color = _COLORS[i % len(_COLORS)]
             datasets.append({
                 'label': instance_name,
                 'data': chart_data,
-                'borderColor': color,
-                'backgroundColor': color.replace('1)', '0.1)'),
+                'borderColor': _rgba(color, 1),
+                'backgroundColor': _rgba(color, 0.1),
                 'fill': False,
                 'tension': 0.1
             })
     
-    # Add chart initialization script
-    html += f"""
-    <script>
-        document.addEventListener('DOMContentLoaded', function() {{
-            const timeSeriesCtx = document.getElementById('timeSeriesChart').getContext('2d');
-            new Chart(timeSeriesCtx, {{
-                type: 'line',
-                data: {{
-                    datasets: {json.dumps(datasets)}
-                }},
-                options: {{
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    scales: {{
-                        x: {{
-                            type: 'category',
-                            title: {{
-                                display: true,
-                                text: 'Time'
-                            }}
-                        }},
-                        y: {{
-                            beginAtZero: true,
-                            max: 100,
-                            title: {{
-                                display: true,
-                                text: 'CPU Utilization (%)'
-                            }}
-                        }}
-                    }},
-                    plugins: {{
-                        legend: {{
-                            display: true
-                        }}
-                    }}
-                }}
-            }});
-        }});
-    </script>
-    """
-    
-    return html
+    # Queue the chart config
+    config_data = {"datasets": datasets}
+    charts.append(_chart_spec('timeSeriesChart', "line", config_data, _TIME_SERIES_OPTS_JSON))
 
 
-def generate_generic_charts(results, benchmark_type):
+def generate_generic_charts(view, benchmark_type, write, charts):
     """Generate charts for generic benchmark types."""
-    html = ""
-    
-    # Find common metrics across all instances
-    common_metrics = set()
-    for instance_data in results.values():
-        metrics = instance_data.get("metrics", {})
-        for key in metrics:
-            if isinstance(metrics[key], (int, float)):
-                common_metrics.add(key)
+    # Numeric metrics reported by every instance; partial ones would chart
+    # their gaps as 0
+    n_instances = len(view.instances)
+    numeric_keys = [
+        frozenset(key for key, value in metrics.items() if isinstance(value, (int, float)))
+        for metrics in view.metrics
+    ]
+    common_metrics = frozenset.intersection(*numeric_keys)
     
-    # Generate a chart for each common metric
-    for metric in common_metrics:
-        chart_id = f"chart_{metric}"
-        html += f'<h3>Metric: {metric}</h3>\n'
-        html += f'<div class="chart-container"><canvas id="{chart_id}"></canvas></div>\n'
+    # Generate a chart for each common metric, in the first instance's order
+    for metric in view.metrics[0]:
+        if metric not in common_metrics:
+            continue
+        datasets = [metrics[metric] for metrics in view.metrics]
         
-        # Prepare data for the chart
-        labels = []
-        datasets = []
+        # All-zero metrics carry no information
+        if not any(datasets):
+            continue
         
-        for instance_name, data in results.items():
-            labels.append(instance_name)
-            value = data.get("metrics", {}).get(metric, 0)
-            datasets.append(value)
+        write(f'<h3>Metric: {escape(metric)}</h3>\n')
         
-        # Add chart initialization script
-        html += f"""
-        <script>
-            document.addEventListener('DOMContentLoaded', function() {{
-                const ctx = document.getElementById('{chart_id}').getContext('2d');
-                new Chart(ctx, {{
-                    type: 'bar',
-                    data: {{
-                        labels: {json.dumps(labels)},
-                        datasets: [{{
-                            label: '{metric}',
-                            data: {json.dumps(datasets)},
-                            backgroundColor: 'rgba(75, 192, 192, 0.5)',
-                            borderColor: 'rgba(75, 192, 192, 1)',
-                            borderWidth: 1
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        maintainAspectRatio: false,
-                        plugins: {{
-                            datalabels: {{
-                                anchor: 'end',
-                                align: 'top',
-                                formatter: function(value) {{
-                                    return value.toFixed(1);
-                                }},
-                                font: {{
-                                    weight: 'bold'
-                                }}
-                            }}
-                        }},
-                        scales: {{
-                            y: {{
-                                beginAtZero: true
-                            }}
-                        }}
-                    }},
-                    plugins: [ChartDataLabels]
-                }});
-            }});
-        </script>
-        """
-    
-    return html
\ No newline at end of file
+        # A chart of identical bars says nothing; state the shared value instead
+        if n_instances > 1 and len(set(datasets)) == 1:
+            write(f'<p>{datasets[0]} on all instances</p>\n')
+            continue
+        
+        # Index-based id: unique across benchmark types and safe in the attribute
+        chart_id = f"chart_{len(charts)}"
+        write(f'<div class="chart-container"><canvas id="{chart_id}"></canvas></div>\n')
+        
+        # Prepare data for the chart
+        labels = view.instances
+        
+        # Queue the chart config
+        config_data = {
+            "labels": labels,
+            "datasets": [{
+                "label": metric,
+                "data": datasets,
+                "backgroundColor": "rgba(75, 192, 192, 0.5)",
+                "borderColor": "rgba(75, 192, 192, 1)",
+                "borderWidth": 1
+            }]
+        }
+        charts.append(_chart_spec(chart_id, "bar", config_data, _GENERIC_BAR_OPTS_JSON))